@@ -399,9 +399,10 @@ class KubeCoreContextFunction:
         
         if transitive_discovery_found:
             context['enableTransitiveDiscovery'] = transitive_discovery_value
-            self.logger.info(f"🎯 PHASE 1 SUCCESS: enableTransitiveDiscovery = {transitive_discovery_value}")
+            self.logger.debug("enableTransitiveDiscovery = %s", transitive_discovery_value)
         else:
-            self.logger.warning("❌ PHASE 1 ISSUE: enableTransitiveDiscovery not found in any expected location")
+            # Not an error: the query processor defaults transitive discovery to enabled
+            self.logger.debug("enableTransitiveDiscovery not set, using default")
 
         # Process input.spec.context if available (preserve existing merge logic)
         if input_spec and 'context' in input_spec:
@@ -6,15 +6,167 @@ and context-driven response generation.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
-from .resource_resolver import ResourceResolver
+from .resource_resolver import ResourceRef, ResourceResolver
 from .resource_summarizer import ResourceSummarizer
-from .schema_registry import SchemaRegistry
+from .schema_registry import ResourceSchema, SchemaRegistry
 from .transitive_discovery import TransitiveDiscoveryEngine, TransitiveDiscoveryConfig
 
+# Mapping from common request names to actual schema names in the registry
+_SCHEMA_NAME_MAPPING: dict[str, str] = {
+    "kubEnv": "XKubEnv",
+    "kubeCluster": "XKubeCluster",
+    "kubeSystem": "XKubeSystem",
+    "kubeNet": "XKubeNet",
+    "qualityGate": "XQualityGate",
+    "githubProject": "XGitHubProject",
+    "githubProvider": "XGitHubProvider",
+    "githubApp": "XGitHubApp",
+    "app": "XApp"
+}
+
+# Reverse of the mapping above: Kubernetes kind to its context reference key
+_KIND_TO_REF_TYPE: dict[str, str] = {
+    kind: f"{requested_name}Refs" for requested_name, kind in _SCHEMA_NAME_MAPPING.items()
+}
+
+_PLATFORM_API = "platform.kubecore.io/v1alpha1"
+_APP_API = "app.kubecore.io/v1alpha1"
+_GITHUB_API = "github.platform.kubecore.io/v1alpha1"
+
+# API version of each platform kind, used to build transitive discovery targets
+_API_VERSION_BY_KIND: dict[str, str] = {
+    "XApp": _APP_API,
+    "XKubeSystem": _PLATFORM_API,
+    "XKubEnv": _PLATFORM_API,
+    "XKubeCluster": _PLATFORM_API,
+    "XGitHubProject": _GITHUB_API,
+    "XGitHubApp": _GITHUB_API,
+    "XQualityGate": _PLATFORM_API,
+}
+
+
+def _reverse_search(kind: str, api_version: str, ref_field: str) -> tuple[str, str, str, str | None]:
+    """Build a reverse discovery search entry with its precomputed ref type."""
+    return kind, api_version, ref_field, _KIND_TO_REF_TYPE.get(kind)
+
+
+# Kinds searched for references to each target kind, as
+# (kind, api_version, ref_field, ref_type) entries
+_REVERSE_DISCOVERY_MAP: dict[str, tuple[tuple[str, str, str, str | None], ...]] = {
+    "XGitHubProject": (
+        _reverse_search("XKubeCluster", _PLATFORM_API, "githubProjectRef"),
+        _reverse_search("XKubEnv", _PLATFORM_API, "githubProjectRef"),
+        _reverse_search("XApp", _APP_API, "githubProjectRef"),
+        _reverse_search("XGitHubApp", _GITHUB_API, "githubProjectRef"),
+        _reverse_search("XQualityGate", _PLATFORM_API, "githubProjectRef"),
+    ),
+    "XKubeCluster": (
+        _reverse_search("XKubeSystem", _PLATFORM_API, "kubeClusterRef"),
+        _reverse_search("XKubEnv", _PLATFORM_API, "kubeClusterRef"),
+    ),
+    "XKubeNet": (
+        _reverse_search("XKubeCluster", _PLATFORM_API, "kubeNetRef"),
+    ),
+    "XQualityGate": (
+        _reverse_search("XKubEnv", _PLATFORM_API, "qualityGates"),
+        _reverse_search("XApp", _APP_API, "qualityGates"),
+    ),
+}
+
+# Reverse discovery ref fields holding a single object reference; every other
+# searched field holds a list of references
+_DIRECT_REF_FIELDS: frozenset[str] = frozenset(
+    ref_field
+    for searches in _REVERSE_DISCOVERY_MAP.values()
+    for _, _, ref_field, _ in searches
+    if ref_field.endswith("Ref")
+)
+
+# Static direct relationships advertised for each requestor type. These never
+# change between queries, so they are built once at import time.
+_XAPP_RELATIONSHIPS: tuple[dict[str, str], ...] = (
+    {
+        "type": "kubEnv",
+        "cardinality": "N:N",
+        "description": "App can deploy to multiple environments"
+    },
+    {
+        "type": "githubProject",
+        "cardinality": "1:1",
+        "description": "App belongs to a GitHub project"
+    },
+)
+
+_XKUBESYSTEM_RELATIONSHIPS: tuple[dict[str, str], ...] = (
+    {
+        "type": "kubeCluster",
+        "cardinality": "1:1",
+        "description": "System belongs to a cluster"
+    },
+    {
+        "type": "kubEnv",
+        "cardinality": "1:N",
+        "description": "System hosts multiple environments"
+    },
+)
+
+_XKUBENV_RELATIONSHIPS: tuple[dict[str, str], ...] = (
+    {
+        "type": "kubeCluster",
+        "cardinality": "1:1",
+        "description": "Environment runs on a cluster"
+    },
+    {
+        "type": "qualityGate",
+        "cardinality": "N:N",
+        "description": "Environment applies quality gates"
+    },
+)
+
+_REQUESTOR_DEFAULT_NS = "default"
+
+_SummaryBuilder = Callable[["QueryProcessor", dict[str, Any]], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class _QueryConfig:
+    """Per-requestor-type query processing configuration."""
+
+    # First element of the availableSchemas relationshipPath
+    path_prefix: str
+    direct_relationships: tuple[dict[str, str], ...] = ()
+    # Summary builders keyed by requested schema name; schemas without an
+    # entry fall back to QueryProcessor._create_generic_summary
+    summarizers: dict[str, _SummaryBuilder] = field(default_factory=dict)
+
+
+_GENERIC_QUERY_CONFIG = _QueryConfig(path_prefix="generic")
+
+
+def _new_platform_context(
+    resource_type: str,
+    context: dict[str, Any],
+    config: _QueryConfig,
+) -> dict[str, Any]:
+    """Build the platform context skeleton returned for a query."""
+    return {
+        "requestor": {
+            "type": resource_type,
+            "name": context.get("requestorName", "unknown"),
+            "namespace": context.get("requestorNamespace", _REQUESTOR_DEFAULT_NS)
+        },
+        "availableSchemas": {},
+        "relationships": {"direct": [dict(rel) for rel in config.direct_relationships]},
+        "insights": {}
+    }
+
 
 class QueryProcessor:
     """Processes queries with resource-type-specific logic."""
@@ -45,6 +197,9 @@ class QueryProcessor:
         # Transitive discovery engine
         self.transitive_discovery_engine: TransitiveDiscoveryEngine | None = None
 
+        # Schema info keyed by requested schema name (see _get_schema_info_for)
+        self._schema_info_cache: dict[str, ResourceSchema | None] = {}
+
     async def process_query(self, input_spec: dict[str, Any]) -> dict[str, Any]:
         """Process query and generate response with Phase 4 optimizations.
         
@@ -54,30 +209,24 @@ class QueryProcessor:
         Returns:
             Processed platform context response
         """
-        start_time = time.time()
+        # Timing is only reported at DEBUG level, so skip the clock reads otherwise
+        start_ns = time.perf_counter_ns() if self.logger.isEnabledFor(logging.DEBUG) else None
         query = input_spec.get("query", {})
         context = input_spec.get("context", {})
         
-        self.logger.debug(f"Processing query: {query}")
-        self.logger.debug(f"Context: {context}")
+        self.logger.debug("Processing query: %s", query)
+        self.logger.debug("Context: %s", context)
 
         resource_type = query.get("resourceType")
         if not resource_type:
             self.logger.error("resourceType is required in query")
             raise ValueError("resourceType is required in query")
 
-        self.logger.info(f"Processing query for resource type: {resource_type}")
+        self.logger.info("Processing query for resource type: %s", resource_type)
 
-        # Route to specific processing logic based on resource type
+        # Per-type processing is driven by the module-level tables
         try:
-            if resource_type == "XApp":
-                result = await self._process_app_query(input_spec)
-            elif resource_type == "XKubeSystem":
-                result = await self._process_kubesystem_query(input_spec)
-            elif resource_type == "XKubEnv":
-                result = await self._process_kubenv_query(input_spec)
-            else:
-                result = await self._process_generic_query(input_spec)
+            result = await self._process_typed_query(input_spec, resource_type)
 
             # Perform reverse discovery if required
             if context.get("requiresReverseDiscovery") and "discoveryHints" in context:
@@ -87,423 +236,104 @@ class QueryProcessor:
             if context.get("enableTransitiveDiscovery", True) and self.transitive_discovery_engine:
                 await self._perform_transitive_discovery(result, context, resource_type)
 
-            duration = time.time() - start_time
-            self.logger.debug(f"Query processing completed in {duration*1000:.1f}ms")
+            if start_ns is not None:
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                self.logger.debug("Query processing completed in %.1fms", duration_ms)
             return result
 
         except Exception as e:
-            duration = time.time() - start_time
-            self.logger.error(f"Query processing failed after {duration*1000:.1f}ms: {e}")
+            if start_ns is not None:
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                self.logger.error("Query processing failed after %.1fms: %s", duration_ms, e)
+            else:
+                self.logger.error("Query processing failed: %s", e)
             raise
 
-    async def _process_app_query(self, input_spec: dict[str, Any]) -> dict[str, Any]:
-        """Process XApp-specific query.
-        
-        XApp queries focus on deployment environments and resource optimization.
-        """
-        query = input_spec.get("query", {})
-        context = input_spec.get("context", {})
-
-        # Get available schemas for XApp
-        accessible_schemas = self.schema_registry.get_accessible_schemas("XApp")
-        requested_schemas = query.get("requestedSchemas", [])
-
-        self.logger.debug(f"XApp accessible schemas: {accessible_schemas}")
-        self.logger.debug(f"XApp requested schemas: {requested_schemas}")
-
-        # Map requested schema names to actual schema names and check accessibility
-        target_schemas = []
-        for schema in requested_schemas:
-            actual_schema_name = self._map_requested_to_actual_schema(schema)
-            if actual_schema_name in accessible_schemas:
-                target_schemas.append(schema)
-
-        self.logger.debug(f"XApp target schemas: {target_schemas}")
-
-        # Build platform context
-        platform_context = {
-            "requestor": {
-                "type": "XApp",
-                "name": context.get("requestorName", "unknown"),
-                "namespace": context.get("requestorNamespace", "default")
-            },
-            "availableSchemas": {},
-            "relationships": {"direct": []},
-            "insights": {}
-        }
-
-        # Process schemas in parallel for better performance
-        if target_schemas and self.performance_optimizer:
-            try:
-                # Use parallel processing for multiple schemas
-                await self._process_schemas_parallel(
-                    target_schemas, context, platform_context, "app"
-                )
-            except Exception as e:
-                self.logger.warning(f"Parallel schema processing failed, falling back to sequential: {e}")
-                # Fallback to sequential processing
-                for schema_type in target_schemas:
-                    await self._process_schema_for_app(
-                        schema_type, context, platform_context
-                    )
-        else:
-            # Sequential processing fallback
-            for schema_type in target_schemas:
-                await self._process_schema_for_app(
-                    schema_type, context, platform_context
-                )
-
-        # Also process schemas even if no references exist (for empty reference test)
-        for schema_type in requested_schemas:
-            if schema_type not in platform_context["availableSchemas"] and schema_type in accessible_schemas:
-                await self._process_schema_for_app(
-                    schema_type, context, platform_context
-                )
-
-        # Add XApp-specific relationship information
-        platform_context["relationships"]["direct"].extend([
-            {
-                "type": "kubEnv",
-                "cardinality": "N:N",
-                "description": "App can deploy to multiple environments"
-            },
-            {
-                "type": "githubProject",
-                "cardinality": "1:1",
-                "description": "App belongs to a GitHub project"
-            }
-        ])
-
-        return platform_context
+    async def _process_typed_query(
+        self,
+        input_spec: dict[str, Any],
+        resource_type: str,
+    ) -> dict[str, Any]:
+        """Process a query for the given requestor resource type.
 
-    async def _process_kubesystem_query(self, input_spec: dict[str, Any]) -> dict[str, Any]:
-        """Process XKubeSystem-specific query.
-        
-        XKubeSystem queries focus on cluster infrastructure and system components.
+        Per-type behaviour (summary builders, direct relationships and the
+        relationship path prefix) is looked up once from ``_QUERY_CONFIG``;
+        resource types without an entry get generic processing.
         """
         query = input_spec.get("query", {})
         context = input_spec.get("context", {})
+        config = _QUERY_CONFIG.get(resource_type, _GENERIC_QUERY_CONFIG)
 
-        accessible_schemas = self.schema_registry.get_accessible_schemas("XKubeSystem")
         requested_schemas = query.get("requestedSchemas", [])
+        if not requested_schemas:
+            return _new_platform_context(resource_type, context, config)
 
-        self.logger.debug(f"XKubeSystem accessible schemas: {accessible_schemas}")
-        self.logger.debug(f"XKubeSystem requested schemas: {requested_schemas}")
+        accessible_schemas = self.schema_registry.get_accessible_schema_set(resource_type)
 
-        # Map requested schema names to actual schema names and check accessibility
-        target_schemas = []
-        for schema in requested_schemas:
-            actual_schema_name = self._map_requested_to_actual_schema(schema)
-            if actual_schema_name in accessible_schemas:
-                target_schemas.append(schema)
-
-        self.logger.debug(f"XKubeSystem target schemas: {target_schemas}")
-
-        platform_context = {
-            "requestor": {
-                "type": "XKubeSystem",
-                "name": context.get("requestorName", "unknown"),
-                "namespace": context.get("requestorNamespace", "default")
-            },
-            "availableSchemas": {},
-            "relationships": {"direct": []},
-            "insights": {}
-        }
-
-        # Process each requested schema
-        for schema_type in target_schemas:
-            await self._process_schema_for_kubesystem(
-                schema_type, context, platform_context
-            )
-
-        # Also process schemas even if no references exist
-        for schema_type in requested_schemas:
-            if schema_type not in platform_context["availableSchemas"] and schema_type in accessible_schemas:
-                await self._process_schema_for_kubesystem(
-                    schema_type, context, platform_context
-                )
-
-        # Add XKubeSystem-specific relationships
-        platform_context["relationships"]["direct"].extend([
-            {
-                "type": "kubeCluster",
-                "cardinality": "1:1",
-                "description": "System belongs to a cluster"
-            },
-            {
-                "type": "kubEnv",
-                "cardinality": "1:N",
-                "description": "System hosts multiple environments"
-            }
-        ])
-
-        return platform_context
+        self.logger.debug("%s accessible schemas: %s", resource_type, accessible_schemas)
+        self.logger.debug("%s requested schemas: %s", resource_type, requested_schemas)
 
-    async def _process_kubenv_query(self, input_spec: dict[str, Any]) -> dict[str, Any]:
-        """Process XKubEnv-specific query.
-        
-        XKubEnv queries focus on environment configuration and resource constraints.
-        """
-        query = input_spec.get("query", {})
-        context = input_spec.get("context", {})
-
-        accessible_schemas = self.schema_registry.get_accessible_schemas("XKubEnv")
-        requested_schemas = query.get("requestedSchemas", [])
-
-        self.logger.debug(f"XKubEnv accessible schemas: {accessible_schemas}")
-        self.logger.debug(f"XKubEnv requested schemas: {requested_schemas}")
-
-        # Map requested schema names to actual schema names and check accessibility
+        # Single pass over the requested schemas: map each name once, keep the
+        # accessible ones and resolve their references and schema info
+        references = context.get("references") or {}
         target_schemas = []
-        for schema in requested_schemas:
-            actual_schema_name = self._map_requested_to_actual_schema(schema)
-            if actual_schema_name in accessible_schemas:
-                target_schemas.append(schema)
-
-        self.logger.debug(f"XKubEnv target schemas: {target_schemas}")
-
-        platform_context = {
-            "requestor": {
-                "type": "XKubEnv",
-                "name": context.get("requestorName", "unknown"),
-                "namespace": context.get("requestorNamespace", "default")
-            },
-            "availableSchemas": {},
-            "relationships": {"direct": []},
-            "insights": {}
-        }
-
-        # Process each requested schema
-        for schema_type in target_schemas:
-            await self._process_schema_for_kubenv(
-                schema_type, context, platform_context
-            )
-
-        # Also process schemas even if no references exist
+        refs_by_type = {}
+        schema_infos = {}
         for schema_type in requested_schemas:
-            if schema_type not in platform_context["availableSchemas"] and schema_type in accessible_schemas:
-                await self._process_schema_for_kubenv(
-                    schema_type, context, platform_context
-                )
-
-        # Add XKubEnv-specific relationships
-        platform_context["relationships"]["direct"].extend([
-            {
-                "type": "kubeCluster",
-                "cardinality": "1:1",
-                "description": "Environment runs on a cluster"
-            },
-            {
-                "type": "qualityGate",
-                "cardinality": "N:N",
-                "description": "Environment applies quality gates"
-            }
-        ])
+            actual_schema = self._map_requested_to_actual_schema(schema_type)
+            if actual_schema not in accessible_schemas:
+                continue
+            target_schemas.append(schema_type)
+            refs_by_type[schema_type] = references.get(schema_type + "Refs", [])
+            schema_infos[schema_type] = self._get_schema_info_for(schema_type)
 
-        return platform_context
+        self.logger.debug("%s target schemas: %s", resource_type, target_schemas)
 
-    async def _process_generic_query(self, input_spec: dict[str, Any]) -> dict[str, Any]:
-        """Process generic query for other resource types."""
-        query = input_spec.get("query", {})
-        context = input_spec.get("context", {})
-        resource_type = query.get("resourceType")
+        platform_context = _new_platform_context(resource_type, context, config)
 
-        accessible_schemas = self.schema_registry.get_accessible_schemas(resource_type)
-        requested_schemas = query.get("requestedSchemas", [])
-
-        target_schemas = [
-            schema for schema in requested_schemas
-            if schema in accessible_schemas
-        ]
-
-        platform_context = {
-            "requestor": {
-                "type": resource_type,
-                "name": context.get("requestorName", "unknown"),
-                "namespace": context.get("requestorNamespace", "default")
-            },
-            "availableSchemas": {},
-            "relationships": {"direct": []},
-            "insights": {}
-        }
-
-        # Process each requested schema
-        for schema_type in target_schemas:
-            await self._process_schema_generic(
-                schema_type, context, platform_context
-            )
-
-        # Also process schemas even if no references exist
-        for schema_type in requested_schemas:
-            if schema_type not in platform_context["availableSchemas"] and schema_type in accessible_schemas:
-                await self._process_schema_generic(
-                    schema_type, context, platform_context
-                )
+        # Schemas without references still get an entry with an empty instance list
+        self._process_schemas(
+            target_schemas, schema_infos, refs_by_type, platform_context["availableSchemas"], config
+        )
 
         return platform_context
 
-    async def _process_schema_for_app(
+    def _process_schema(
         self,
         schema_type: str,
-        context: dict[str, Any],
-        platform_context: dict[str, Any],
+        schema_info: ResourceSchema | None,
+        refs: list[dict[str, Any]],
+        available_schemas: dict[str, Any],
+        config: _QueryConfig,
     ) -> None:
-        """Process a specific schema for XApp queries."""
-        # Map requested schema name to actual schema name
-        actual_schema_name = self._map_requested_to_actual_schema(schema_type)
-        schema_info = self.schema_registry.get_schema_info(actual_schema_name)
+        """Process a specific schema using the requestor type's configuration."""
         if not schema_info:
             return
 
-        # Get instances from context references
-        ref_key = f"{schema_type}Refs"
-        refs = context.get("references", {}).get(ref_key, [])
-
-        instances = []
-        for ref in refs:
-            # Create summary based on schema type and XApp needs
-            if schema_type == "kubEnv":
-                summary = await self._create_kubenv_summary_for_app(ref)
-            elif schema_type == "githubProject":
-                summary = await self._create_project_summary_for_app(ref)
-            else:
-                summary = await self._create_generic_summary(ref)
+        # Create summaries tailored to what the requestor type needs
+        builder = config.summarizers.get(schema_type, QueryProcessor._create_generic_summary)
 
-            instances.append({
+        instances = [
+            {
                 "name": ref.get("name", "unknown"),
                 "namespace": ref.get("namespace", "default"),
-                "summary": summary
-            })
+                "summary": builder(self, ref)
+            }
+            for ref in refs
+        ]
 
         # Use the requested schema name as the key, not the actual schema name
-        platform_context["availableSchemas"][schema_type] = {
-            "metadata": {
-                "apiVersion": schema_info.api_version,
-                "kind": schema_info.kind,
-                "accessible": True,
-                "relationshipPath": ["app", schema_type]
-            },
-            "instances": instances
-        }
-
-    async def _process_schema_for_kubesystem(
-        self,
-        schema_type: str,
-        context: dict[str, Any],
-        platform_context: dict[str, Any],
-    ) -> None:
-        """Process a specific schema for XKubeSystem queries."""
-        # Map requested schema name to actual schema name
-        actual_schema_name = self._map_requested_to_actual_schema(schema_type)
-        schema_info = self.schema_registry.get_schema_info(actual_schema_name)
-        if not schema_info:
-            return
-
-        ref_key = f"{schema_type}Refs"
-        refs = context.get("references", {}).get(ref_key, [])
-
-        instances = []
-        for ref in refs:
-            if schema_type == "kubeCluster":
-                summary = await self._create_cluster_summary_for_system(ref)
-            elif schema_type == "kubEnv":
-                summary = await self._create_kubenv_summary_for_system(ref)
-            else:
-                summary = await self._create_generic_summary(ref)
-
-            instances.append({
-                "name": ref.get("name", "unknown"),
-                "namespace": ref.get("namespace", "default"),
-                "summary": summary
-            })
-
-        platform_context["availableSchemas"][schema_type] = {
-            "metadata": {
-                "apiVersion": schema_info.api_version,
-                "kind": schema_info.kind,
-                "accessible": True,
-                "relationshipPath": ["kubeSystem", schema_type]
-            },
-            "instances": instances
-        }
-
-    async def _process_schema_for_kubenv(
-        self,
-        schema_type: str,
-        context: dict[str, Any],
-        platform_context: dict[str, Any],
-    ) -> None:
-        """Process a specific schema for XKubEnv queries."""
-        # Map requested schema name to actual schema name
-        actual_schema_name = self._map_requested_to_actual_schema(schema_type)
-        schema_info = self.schema_registry.get_schema_info(actual_schema_name)
-        if not schema_info:
-            return
-
-        ref_key = f"{schema_type}Refs"
-        refs = context.get("references", {}).get(ref_key, [])
-
-        instances = []
-        for ref in refs:
-            if schema_type == "qualityGate":
-                summary = await self._create_quality_gate_summary(ref)
-            elif schema_type == "kubeCluster":
-                summary = await self._create_cluster_summary_for_env(ref)
-            else:
-                summary = await self._create_generic_summary(ref)
-
-            instances.append({
-                "name": ref.get("name", "unknown"),
-                "namespace": ref.get("namespace", "default"),
-                "summary": summary
-            })
-
-        platform_context["availableSchemas"][schema_type] = {
-            "metadata": {
-                "apiVersion": schema_info.api_version,
-                "kind": schema_info.kind,
-                "accessible": True,
-                "relationshipPath": ["kubEnv", schema_type]
-            },
-            "instances": instances
-        }
-
-    async def _process_schema_generic(
-        self,
-        schema_type: str,
-        context: dict[str, Any],
-        platform_context: dict[str, Any],
-    ) -> None:
-        """Process a schema for generic resource types."""
-        # Map requested schema name to actual schema name
-        actual_schema_name = self._map_requested_to_actual_schema(schema_type)
-        schema_info = self.schema_registry.get_schema_info(actual_schema_name)
-        if not schema_info:
-            return
-
-        ref_key = f"{schema_type}Refs"
-        refs = context.get("references", {}).get(ref_key, [])
-
-        instances = []
-        for ref in refs:
-            summary = await self._create_generic_summary(ref)
-            instances.append({
-                "name": ref.get("name", "unknown"),
-                "namespace": ref.get("namespace", "default"),
-                "summary": summary
-            })
-
-        platform_context["availableSchemas"][schema_type] = {
+        available_schemas[schema_type] = {
             "metadata": {
                 "apiVersion": schema_info.api_version,
                 "kind": schema_info.kind,
                 "accessible": True,
-                "relationshipPath": ["generic", schema_type]
+                "relationshipPath": [config.path_prefix, schema_type]
             },
             "instances": instances
         }
 
-    async def _create_kubenv_summary_for_app(self, ref: dict[str, Any]) -> dict[str, Any]:
+    def _create_kubenv_summary_for_app(self, ref: dict[str, Any]) -> dict[str, Any]:
         """Create KubEnv summary optimized for XApp needs."""
         return {
             "environmentType": "dev",  # Would be resolved from actual resource
@@ -517,7 +347,7 @@ class QueryProcessor:
             "qualityGates": ["security-scan", "performance-test"]
         }
 
-    async def _create_project_summary_for_app(self, ref: dict[str, Any]) -> dict[str, Any]:
+    def _create_project_summary_for_app(self, ref: dict[str, Any]) -> dict[str, Any]:
         """Create GitHub project summary for XApp needs."""
         return {
             "repository": ref.get("name", "unknown"),
@@ -525,7 +355,7 @@ class QueryProcessor:
             "cicdEnabled": True
         }
 
-    async def _create_cluster_summary_for_system(self, ref: dict[str, Any]) -> dict[str, Any]:
+    def _create_cluster_summary_for_system(self, ref: dict[str, Any]) -> dict[str, Any]:
         """Create cluster summary for XKubeSystem needs."""
         return {
             "version": "1.28.0",
@@ -534,7 +364,7 @@ class QueryProcessor:
             "status": "ready"
         }
 
-    async def _create_kubenv_summary_for_system(self, ref: dict[str, Any]) -> dict[str, Any]:
+    def _create_kubenv_summary_for_system(self, ref: dict[str, Any]) -> dict[str, Any]:
         """Create KubEnv summary for XKubeSystem needs."""
         return {
             "environmentType": "dev",
@@ -542,7 +372,7 @@ class QueryProcessor:
             "systemComponents": ["ingress", "monitoring"]
         }
 
-    async def _create_cluster_summary_for_env(self, ref: dict[str, Any]) -> dict[str, Any]:
+    def _create_cluster_summary_for_env(self, ref: dict[str, Any]) -> dict[str, Any]:
         """Create cluster summary for XKubEnv needs."""
         return {
             "version": "1.28.0",
@@ -553,7 +383,7 @@ class QueryProcessor:
             }
         }
 
-    async def _create_quality_gate_summary(self, ref: dict[str, Any]) -> dict[str, Any]:
+    def _create_quality_gate_summary(self, ref: dict[str, Any]) -> dict[str, Any]:
         """Create quality gate summary."""
         return {
             "key": ref.get("name", "unknown"),
@@ -562,29 +392,31 @@ class QueryProcessor:
             "required": True
         }
 
-    async def _create_generic_summary(self, ref: dict[str, Any]) -> dict[str, Any]:
+    def _create_generic_summary(self, ref: dict[str, Any]) -> dict[str, Any]:
         """Create a generic summary for any resource type."""
         return {
             "name": ref.get("name", "unknown"),
             "status": "available"
         }
 
-    def _map_requested_to_actual_schema(self, requested_name: str) -> str:
+    @staticmethod
+    def _map_requested_to_actual_schema(requested_name: str) -> str:
         """Map requested schema names to actual schema names in the registry."""
-        # Mapping from common request names to actual schema names
-        schema_name_mapping = {
-            "kubEnv": "XKubEnv",
-            "kubeCluster": "XKubeCluster",
-            "kubeSystem": "XKubeSystem",
-            "kubeNet": "XKubeNet",
-            "qualityGate": "XQualityGate",
-            "githubProject": "XGitHubProject",
-            "githubProvider": "XGitHubProvider",
-            "githubApp": "XGitHubApp",
-            "app": "XApp"
-        }
+        return _SCHEMA_NAME_MAPPING.get(requested_name, requested_name)
 
-        return schema_name_mapping.get(requested_name, requested_name)
+    def _get_schema_info_for(self, requested_name: str) -> ResourceSchema | None:
+        """Get registry schema info for a requested schema name, memoized.
+
+        Registry schemas are loaded once at startup, so misses are cached too.
+        """
+        try:
+            return self._schema_info_cache[requested_name]
+        except KeyError:
+            schema_info = self.schema_registry.get_schema_info(
+                self._map_requested_to_actual_schema(requested_name)
+            )
+            self._schema_info_cache[requested_name] = schema_info
+            return schema_info
 
     async def _discover_reverse_relationships(
         self,
@@ -607,29 +439,8 @@ class QueryProcessor:
         Returns:
             Dictionary of discovered reverse references
         """
-        # Define reverse discovery mapping
-        reverse_discovery_map = {
-            "XGitHubProject": [
-                ("XKubeCluster", "platform.kubecore.io/v1alpha1", "githubProjectRef"),
-                ("XKubEnv", "platform.kubecore.io/v1alpha1", "githubProjectRef"), 
-                ("XApp", "app.kubecore.io/v1alpha1", "githubProjectRef"),
-                ("XGitHubApp", "github.platform.kubecore.io/v1alpha1", "githubProjectRef"),
-                ("XQualityGate", "platform.kubecore.io/v1alpha1", "githubProjectRef")
-            ],
-            "XKubeCluster": [
-                ("XKubeSystem", "platform.kubecore.io/v1alpha1", "kubeClusterRef"),
-                ("XKubEnv", "platform.kubecore.io/v1alpha1", "kubeClusterRef")
-            ],
-            "XKubeNet": [
-                ("XKubeCluster", "platform.kubecore.io/v1alpha1", "kubeNetRef")
-            ],
-            "XQualityGate": [
-                ("XKubEnv", "platform.kubecore.io/v1alpha1", "qualityGates"),
-                ("XApp", "app.kubecore.io/v1alpha1", "qualityGates")
-            ]
-        }
-        
-        if resource_type not in reverse_discovery_map:
+        search_configs = _REVERSE_DISCOVERY_MAP.get(resource_type)
+        if not search_configs:
             return {}
             
         target_name = target_ref.get("name")
@@ -639,56 +450,31 @@ class QueryProcessor:
             return {}
             
         discovered_refs = {}
-        search_configs = reverse_discovery_map[resource_type]
+        # Resource listings shared by searches of the same kind in this request
+        list_cache: dict[tuple[str, str], asyncio.Future] = {}
         
-        # Process searches in parallel if performance optimizer is available
-        if self.performance_optimizer and len(search_configs) > 1:
-            try:
-                import asyncio
-                tasks = [
-                    self._search_for_reverse_refs(
-                        target_name, target_namespace, kind, api_version, ref_field
-                    ) 
-                    for kind, api_version, ref_field in search_configs
-                ]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Process results
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        self.logger.warning(f"Reverse discovery search failed: {result}")
-                        continue
-                    kind = search_configs[i][0]
-                    ref_type = self._kind_to_ref_type(kind)
-                    if result and ref_type:
-                        discovered_refs[ref_type] = result
-                        
-            except Exception as e:
-                self.logger.warning(f"Parallel reverse discovery failed, using sequential: {e}")
-                # Fall back to sequential processing
-                for kind, api_version, ref_field in search_configs:
-                    try:
-                        refs = await self._search_for_reverse_refs(
-                            target_name, target_namespace, kind, api_version, ref_field
-                        )
-                        ref_type = self._kind_to_ref_type(kind)
-                        if refs and ref_type:
-                            discovered_refs[ref_type] = refs
-                    except Exception as e:
-                        self.logger.warning(f"Sequential reverse discovery failed for {kind}: {e}")
-        else:
-            # Sequential processing
-            for kind, api_version, ref_field in search_configs:
-                try:
-                    refs = await self._search_for_reverse_refs(
-                        target_name, target_namespace, kind, api_version, ref_field
-                    )
-                    ref_type = self._kind_to_ref_type(kind)
-                    if refs and ref_type:
-                        discovered_refs[ref_type] = refs
-                except Exception as e:
-                    self.logger.warning(f"Reverse discovery failed for {kind}: {e}")
-                    
+        search = self._search_for_reverse_refs
+        logger = self.logger
+
+        # Run all searches concurrently; a failed search only drops its own kind
+        results = await asyncio.gather(
+            *(
+                search(
+                    target_name, target_namespace, kind, api_version, ref_field, list_cache
+                )
+                for kind, api_version, ref_field, _ in search_configs
+            ),
+            return_exceptions=True,
+        )
+
+        for (kind, _, _, ref_type), result in zip(search_configs, results, strict=True):
+            # gather returns a cancelled search's CancelledError, which is not an Exception
+            if isinstance(result, BaseException):
+                logger.warning("Reverse discovery failed for %s: %r", kind, result)
+                continue
+            if result and ref_type:
+                discovered_refs[ref_type] = result
+
         return discovered_refs
 
     async def _search_for_reverse_refs(
@@ -697,7 +483,8 @@ class QueryProcessor:
         target_namespace: str | None,
         search_kind: str,
         search_api_version: str,
-        ref_field: str
+        ref_field: str,
+        list_cache: dict[tuple[str, str], asyncio.Future] | None = None
     ) -> list[dict]:
         """
         Search for resources of a specific kind that reference the target.
@@ -708,41 +495,58 @@ class QueryProcessor:
             search_kind: Kind of resources to search
             search_api_version: API version of resources to search
             ref_field: Reference field to check
+            list_cache: Per-request listings keyed by (api_version, kind), so
+                several reference fields on one kind share a single list call
             
         Returns:
             List of resource references that point to target
         """
+        if not target_name:
+            return []
+
+        logger = self.logger
         found_refs = []
         
         try:
-            # List all resources of the search kind
-            list_result = await self.resource_resolver.k8s_client.list_resources(
-                api_version=search_api_version,
-                kind=search_kind,
-                limit=100  # Reasonable limit to avoid excessive API calls
-            )
+            # List all resources of the search kind, once per request
+            if list_cache is None:
+                list_cache = {}
+            cache_key = (search_api_version, search_kind)
+            if cache_key not in list_cache:
+                list_cache[cache_key] = asyncio.ensure_future(
+                    self.resource_resolver.k8s_client.list_resources(
+                        api_version=search_api_version,
+                        kind=search_kind,
+                        limit=100  # Reasonable limit to avoid excessive API calls
+                    )
+                )
+            list_result = await list_cache[cache_key]
             
             items = list_result.get("items", [])
-            self.logger.debug(f"Searching {len(items)} {search_kind} resources for refs to {target_name}")
+            logger.debug("Searching %d %s resources for refs to %s", len(items), search_kind, target_name)
             
-            for item in items:
-                if self._contains_reference_to(item, target_name, target_namespace, ref_field):
-                    metadata = item.get("metadata", {})
-                    found_refs.append({
-                        "name": metadata.get("name"),
-                        "namespace": metadata.get("namespace"),
-                        "apiVersion": search_api_version,
-                        "kind": search_kind
-                    })
+            contains_reference_to = self._contains_reference_to
+            found_refs = [
+                {
+                    "name": metadata.get("name"),
+                    "namespace": metadata.get("namespace"),
+                    "apiVersion": search_api_version,
+                    "kind": search_kind
+                }
+                for item in items
+                if contains_reference_to(item, target_name, target_namespace, ref_field)
+                for metadata in (item.get("metadata", {}),)
+            ]
                     
-            self.logger.debug(f"Found {len(found_refs)} {search_kind} resources referencing {target_name}")
+            logger.debug("Found %d %s resources referencing %s", len(found_refs), search_kind, target_name)
             
         except Exception as e:
-            self.logger.warning(f"Failed to search {search_kind} for references to {target_name}: {e}")
+            logger.warning("Failed to search %s for references to %s: %s", search_kind, target_name, e)
             
         return found_refs
         
-    def _contains_reference_to(self, resource: dict, target_name: str, target_namespace: str | None, ref_field: str) -> bool:
+    @staticmethod
+    def _contains_reference_to(resource: dict, target_name: str, target_namespace: str | None, ref_field: str) -> bool:
         """
         Check if resource contains reference to target.
         
@@ -755,40 +559,39 @@ class QueryProcessor:
         Returns:
             True if resource contains reference to target
         """
-        spec = resource.get("spec", {})
-        
+        spec = resource.get("spec")
+        if not spec:
+            return False
+        ref_value = spec.get(ref_field)
+        if ref_value is None:
+            return False
+        any_namespace = target_namespace is None
+
         # Handle direct reference fields (e.g., githubProjectRef)
-        if ref_field.endswith("Ref"):
-            ref_value = spec.get(ref_field, {})
-            if isinstance(ref_value, dict):
-                return (ref_value.get("name") == target_name and 
-                       (target_namespace is None or ref_value.get("namespace") == target_namespace))
-                       
+        if ref_field in _DIRECT_REF_FIELDS:
+            return (
+                isinstance(ref_value, dict)
+                and ref_value.get("name") == target_name
+                and (any_namespace or ref_value.get("namespace") == target_namespace)
+            )
+
         # Handle reference arrays (e.g., qualityGates)
-        elif ref_field in spec:
-            ref_list = spec.get(ref_field, [])
-            if isinstance(ref_list, list):
-                for ref_item in ref_list:
-                    if isinstance(ref_item, dict):
-                        ref_obj = ref_item.get("ref", ref_item)  # Handle both ref.ref and direct ref structures
-                        if isinstance(ref_obj, dict):
-                            if (ref_obj.get("name") == target_name and 
-                               (target_namespace is None or ref_obj.get("namespace") == target_namespace)):
-                                return True
-        
+        if isinstance(ref_value, list):
+            for ref_item in ref_value:
+                if not isinstance(ref_item, dict):
+                    continue
+                ref_obj = ref_item.get("ref", ref_item)  # Handle both ref.ref and direct ref structures
+                if (isinstance(ref_obj, dict)
+                        and ref_obj.get("name") == target_name
+                        and (any_namespace or ref_obj.get("namespace") == target_namespace)):
+                    return True
+
         return False
         
-    def _kind_to_ref_type(self, kind: str) -> str | None:
+    @staticmethod
+    def _kind_to_ref_type(kind: str) -> str | None:
         """Convert Kubernetes kind to reference type."""
-        kind_to_ref_map = {
-            "XKubeCluster": "kubeClusterRefs",
-            "XKubEnv": "kubEnvRefs", 
-            "XApp": "appRefs",
-            "XGitHubApp": "githubAppRefs",
-            "XQualityGate": "qualityGateRefs",
-            "XKubeSystem": "kubeSystemRefs"
-        }
-        return kind_to_ref_map.get(kind)
+        return _KIND_TO_REF_TYPE.get(kind)
 
     async def _perform_reverse_discovery(self, platform_context: dict[str, Any], context: dict[str, Any]) -> None:
         """
@@ -806,7 +609,7 @@ class QueryProcessor:
             return
             
         resource_type = target_ref.get("kind", "")
-        self.logger.info(f"Performing reverse discovery for {resource_type}: {target_ref.get('name')}")
+        self.logger.info("Performing reverse discovery for %s: %s", resource_type, target_ref.get("name"))
         
         try:
             # Discover reverse relationships
@@ -819,22 +622,31 @@ class QueryProcessor:
                 # Update the context references with discovered reverse references
                 context.setdefault("references", {}).update(discovered_refs)
                 
-                # Process the newly discovered schemas
+                # Process the newly discovered schemas; a failing schema is
+                # logged without dropping the others
                 for ref_type, refs in discovered_refs.items():
                     if refs:  # Only process if we have actual references
                         schema_type = ref_type.replace("Refs", "")  # Convert appRefs -> app
-                        await self._process_discovered_schema(
-                            schema_type, refs, platform_context
-                        )
+                        try:
+                            self._process_discovered_schema(schema_type, refs, platform_context)
+                        except Exception as e:
+                            self.logger.warning(
+                                "Reverse discovery processing failed for %s: %r", schema_type, e
+                            )
                         
-                self.logger.info(f"Reverse discovery completed: found {sum(len(refs) for refs in discovered_refs.values())} references across {len(discovered_refs)} types")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(
+                        "Reverse discovery completed: found %d references across %d types",
+                        sum(len(refs) for refs in discovered_refs.values()),
+                        len(discovered_refs),
+                    )
             else:
-                self.logger.debug(f"No reverse references found for {resource_type}: {target_ref.get('name')}")
+                self.logger.debug("No reverse references found for %s: %s", resource_type, target_ref.get("name"))
                 
         except Exception as e:
-            self.logger.warning(f"Reverse discovery failed: {e}")
+            self.logger.warning("Reverse discovery failed: %s", e)
 
-    async def _process_discovered_schema(
+    def _process_discovered_schema(
         self,
         schema_type: str,
         refs: list[dict],
@@ -848,22 +660,21 @@ class QueryProcessor:
             refs: List of discovered references
             platform_context: Platform context to update
         """
-        # Map requested schema name to actual schema name
-        actual_schema_name = self._map_requested_to_actual_schema(schema_type)
-        schema_info = self.schema_registry.get_schema_info(actual_schema_name)
+        schema_info = self._get_schema_info_for(schema_type)
         if not schema_info:
-            self.logger.warning(f"Schema info not found for {actual_schema_name}")
+            self.logger.warning(
+                "Schema info not found for %s", self._map_requested_to_actual_schema(schema_type)
+            )
             return
 
-        instances = []
-        for ref in refs:
-            # Create summary based on the resource type
-            summary = await self._create_reverse_discovered_summary(ref)
-            instances.append({
+        instances = [
+            {
                 "name": ref.get("name", "unknown"),
                 "namespace": ref.get("namespace", "default"),
-                "summary": summary
-            })
+                "summary": self._create_reverse_discovered_summary(ref)
+            }
+            for ref in refs
+        ]
 
         # Add to platform context
         platform_context["availableSchemas"][schema_type] = {
@@ -877,9 +688,9 @@ class QueryProcessor:
             "instances": instances
         }
         
-        self.logger.debug(f"Added {len(instances)} instances for schema {schema_type} via reverse discovery")
+        self.logger.debug("Added %d instances for schema %s via reverse discovery", len(instances), schema_type)
 
-    async def _create_reverse_discovered_summary(self, ref: dict[str, Any]) -> dict[str, Any]:
+    def _create_reverse_discovered_summary(self, ref: dict[str, Any]) -> dict[str, Any]:
         """Create summary for reverse-discovered resource."""
         return {
             "name": ref.get("name", "unknown"),
@@ -888,58 +699,38 @@ class QueryProcessor:
             "discoveredBy": "reverse-lookup"
         }
 
-    async def _process_schemas_parallel(
+    def _process_schemas(
         self,
         schema_types: list[str],
-        context: dict[str, Any],
-        platform_context: dict[str, Any],
-        resource_category: str
+        schema_infos: dict[str, ResourceSchema | None],
+        refs_by_type: dict[str, list[dict[str, Any]]],
+        available_schemas: dict[str, Any],
+        config: _QueryConfig
     ) -> None:
-        """Process multiple schemas in parallel using the performance optimizer.
-        
+        """Process multiple schemas into ``availableSchemas``.
+
+        Schema processing only builds summaries from the request context and
+        never awaits, so the schemas are processed in a plain loop. A failing
+        schema is logged and skipped without dropping the others.
+
         Args:
             schema_types: List of schema types to process
-            context: Request context
-            platform_context: Platform context to update
-            resource_category: Category of resource (app, kubesystem, kubenv, generic)
+            schema_infos: Prefetched schema info keyed by schema type
+            refs_by_type: Context references keyed by schema type
+            available_schemas: ``availableSchemas`` mapping of the platform context
+            config: Query configuration of the requesting resource type
         """
-        if not self.performance_optimizer or not schema_types:
-            return
-
-        # Define processor function based on resource category
-        async def process_single_schema(schema_type: str) -> tuple[str, dict[str, Any]]:
-            temp_context = {"availableSchemas": {}}
-
-            if resource_category == "app":
-                await self._process_schema_for_app(schema_type, context, temp_context)
-            elif resource_category == "kubesystem":
-                await self._process_schema_for_kubesystem(schema_type, context, temp_context)
-            elif resource_category == "kubenv":
-                await self._process_schema_for_kubenv(schema_type, context, temp_context)
-            else:
-                await self._process_schema_generic(schema_type, context, temp_context)
-
-            return schema_type, temp_context.get("availableSchemas", {}).get(schema_type)
-
-        # Process schemas in parallel
-        try:
-            import asyncio
-            tasks = [process_single_schema(schema_type) for schema_type in schema_types]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Merge results into platform_context
-            for result in results:
-                if isinstance(result, Exception):
-                    self.logger.warning(f"Schema processing error: {result}")
-                    continue
-
-                schema_type, schema_data = result
-                if schema_data:
-                    platform_context["availableSchemas"][schema_type] = schema_data
-
-        except Exception as e:
-            self.logger.error(f"Parallel schema processing failed: {e}")
-            raise
+        for schema_type in schema_types:
+            try:
+                self._process_schema(
+                    schema_type,
+                    schema_infos.get(schema_type),
+                    refs_by_type.get(schema_type, []),
+                    available_schemas,
+                    config,
+                )
+            except Exception as e:
+                self.logger.warning("Schema processing error for %s: %s", schema_type, e)
 
     async def _perform_transitive_discovery(
         self,
@@ -960,14 +751,19 @@ class QueryProcessor:
             
         # Extract target reference for transitive discovery
         requestor = platform_context.get("requestor", {})
+        target_name = requestor.get("name")
+        if target_name in (None, "", "unknown"):
+            self.logger.debug("Skipping transitive discovery: no concrete requestor name")
+            return
+
         target_ref = {
-            "name": requestor.get("name", "unknown"),
+            "name": target_name,
             "namespace": requestor.get("namespace", "default"),
             "kind": resource_type,
             "apiVersion": self._get_api_version_for_kind(resource_type)
         }
         
-        self.logger.info(f"Performing transitive discovery for {resource_type}: {target_ref.get('name')}")
+        self.logger.debug("Performing transitive discovery for %s: %s", resource_type, target_ref.get("name"))
         
         try:
             # Discover transitive relationships
@@ -977,20 +773,30 @@ class QueryProcessor:
             
             # Merge transitive discoveries into platform context
             if transitive_resources:
+                # Merge each schema in turn; a failing schema is logged without
+                # dropping the others
                 for schema_type, resources in transitive_resources.items():
                     if resources:  # Only process if we have actual resources
-                        await self._process_transitive_schema(
-                            schema_type, resources, platform_context
-                        )
+                        try:
+                            self._process_transitive_schema(schema_type, resources, platform_context)
+                        except Exception as e:
+                            self.logger.warning(
+                                "Transitive discovery processing failed for %s: %r", schema_type, e
+                            )
                         
-                self.logger.info(f"Transitive discovery completed: found {sum(len(resources) for resources in transitive_resources.values())} resources across {len(transitive_resources)} types")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(
+                        "Transitive discovery completed: found %d resources across %d types",
+                        sum(len(resources) for resources in transitive_resources.values()),
+                        len(transitive_resources),
+                    )
             else:
-                self.logger.debug(f"No transitive relationships found for {resource_type}: {target_ref.get('name')}")
+                self.logger.debug("No transitive relationships found for %s: %s", resource_type, target_ref.get("name"))
                 
         except Exception as e:
-            self.logger.warning(f"Transitive discovery failed: {e}")
+            self.logger.warning("Transitive discovery failed: %s", e)
 
-    async def _process_transitive_schema(
+    def _process_transitive_schema(
         self,
         schema_type: str,
         transitive_resources: list,
@@ -1004,60 +810,70 @@ class QueryProcessor:
             transitive_resources: List of TransitiveDiscoveredResource objects
             platform_context: Platform context to update
         """
-        # Map requested schema name to actual schema name
-        actual_schema_name = self._map_requested_to_actual_schema(schema_type)
-        schema_info = self.schema_registry.get_schema_info(actual_schema_name)
+        schema_info = self._get_schema_info_for(schema_type)
         if not schema_info:
-            self.logger.warning(f"Schema info not found for {actual_schema_name}")
+            self.logger.warning(
+                "Schema info not found for %s", self._map_requested_to_actual_schema(schema_type)
+            )
             return
 
+        # Skip duplicates, of existing instances or within this batch, before
+        # their summaries are built rather than building and then discarding them
+        available_schemas = platform_context["availableSchemas"]
+        existing_schema = available_schemas.get(schema_type)
+        seen: set[tuple[str, str]] = (
+            {(inst["name"], inst["namespace"]) for inst in existing_schema["instances"]}
+            if existing_schema is not None
+            else set()
+        )
+
+        # Chains often pass through the same intermediate resources; build each
+        # one's entry once and give every instance its own copy
+        intermediate_entries: dict[ResourceRef, dict[str, Any]] = {}
+
         instances = []
         for transitive_resource in transitive_resources:
-            # Create instance data with transitive information
-            instance_data = {
-                "name": transitive_resource.name,
-                "namespace": transitive_resource.namespace,
-                "summary": {
-                    **transitive_resource.summary,
-                    "discoveryHops": transitive_resource.discovery_hops,
-                    "discoveryMethod": transitive_resource.discovery_method,
-                    "relationshipChain": " → ".join(
-                        f"{ref.kind}({ref.name})" for ref in transitive_resource.relationship_path
-                    )
-                }
-            }
-            
+            key = (transitive_resource.name, transitive_resource.namespace)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            # Copy the engine's summary and add the transitive information
+            summary = transitive_resource.summary.copy()
+            summary["discoveryHops"] = transitive_resource.discovery_hops
+            summary["discoveryMethod"] = transitive_resource.discovery_method
+            summary["relationshipChain"] = " → ".join([
+                f"{ref.kind}({ref.name})" for ref in transitive_resource.relationship_path
+            ])
+
             # Add intermediate resources information if present
             if transitive_resource.intermediate_resources:
-                instance_data["summary"]["intermediateResources"] = [
-                    {
-                        "kind": ref.kind,
-                        "name": ref.name,
-                        "namespace": ref.namespace
-                    }
-                    for ref in transitive_resource.intermediate_resources
-                ]
-            
-            instances.append(instance_data)
+                entries = []
+                for ref in transitive_resource.intermediate_resources:
+                    entry = intermediate_entries.get(ref)
+                    if entry is None:
+                        entry = intermediate_entries[ref] = {
+                            "kind": ref.kind,
+                            "name": ref.name,
+                            "namespace": ref.namespace
+                        }
+                    entries.append(dict(entry))
+                summary["intermediateResources"] = entries
 
-        # Check if schema already exists in platform context
-        if schema_type in platform_context["availableSchemas"]:
-            # Merge with existing instances, avoiding duplicates
-            existing_instances = platform_context["availableSchemas"][schema_type]["instances"]
-            existing_names = {(inst["name"], inst["namespace"]) for inst in existing_instances}
-            
-            new_instances = [
-                inst for inst in instances
-                if (inst["name"], inst["namespace"]) not in existing_names
-            ]
-            
-            if new_instances:
-                existing_instances.extend(new_instances)
+            instances.append({
+                "name": transitive_resource.name,
+                "namespace": transitive_resource.namespace,
+                "summary": summary
+            })
+
+        if existing_schema is not None:
+            if instances:
+                existing_schema["instances"].extend(instances)
                 # Update metadata to indicate transitive discovery was used
-                platform_context["availableSchemas"][schema_type]["metadata"]["discoveryMethod"] = "hybrid"
+                existing_schema["metadata"]["discoveryMethod"] = "hybrid"
         else:
             # Add new schema entry
-            platform_context["availableSchemas"][schema_type] = {
+            available_schemas[schema_type] = {
                 "metadata": {
                     "apiVersion": schema_info.api_version,
                     "kind": schema_info.kind,
@@ -1068,22 +884,44 @@ class QueryProcessor:
                 "instances": instances
             }
         
-        self.logger.debug(f"Added {len(instances)} transitive instances for schema {schema_type}")
+        self.logger.debug("Added %d transitive instances for schema %s", len(instances), schema_type)
 
-    def _get_api_version_for_kind(self, kind: str) -> str:
+    @staticmethod
+    def _get_api_version_for_kind(kind: str) -> str:
         """Get the API version for a given Kubernetes kind."""
-        api_version_map = {
-            "XApp": "app.kubecore.io/v1alpha1",
-            "XKubeSystem": "platform.kubecore.io/v1alpha1",
-            "XKubEnv": "platform.kubecore.io/v1alpha1",
-            "XKubeCluster": "platform.kubecore.io/v1alpha1",
-            "XGitHubProject": "github.platform.kubecore.io/v1alpha1",
-            "XGitHubApp": "github.platform.kubecore.io/v1alpha1",
-            "XQualityGate": "platform.kubecore.io/v1alpha1"
-        }
-        return api_version_map.get(kind, "unknown")
+        return _API_VERSION_BY_KIND.get(kind, "unknown")
 
     def set_transitive_discovery_engine(self, engine: TransitiveDiscoveryEngine) -> None:
         """Set the transitive discovery engine instance."""
         self.transitive_discovery_engine = engine
         self.logger.debug("Transitive discovery engine configured")
+
+
+# Processing configuration per requestor type. Defined after the class so the
+# summary builders can be referenced directly.
+_QUERY_CONFIG: dict[str, _QueryConfig] = {
+    "XApp": _QueryConfig(
+        path_prefix="app",
+        direct_relationships=_XAPP_RELATIONSHIPS,
+        summarizers={
+            "kubEnv": QueryProcessor._create_kubenv_summary_for_app,
+            "githubProject": QueryProcessor._create_project_summary_for_app,
+        },
+    ),
+    "XKubeSystem": _QueryConfig(
+        path_prefix="kubeSystem",
+        direct_relationships=_XKUBESYSTEM_RELATIONSHIPS,
+        summarizers={
+            "kubeCluster": QueryProcessor._create_cluster_summary_for_system,
+            "kubEnv": QueryProcessor._create_kubenv_summary_for_system,
+        },
+    ),
+    "XKubEnv": _QueryConfig(
+        path_prefix="kubEnv",
+        direct_relationships=_XKUBENV_RELATIONSHIPS,
+        summarizers={
+            "qualityGate": QueryProcessor._create_quality_gate_summary,
+            "kubeCluster": QueryProcessor._create_cluster_summary_for_env,
+        },
+    ),
+}
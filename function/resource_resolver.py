@@ -8,16 +8,87 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 import time
-from collections import deque
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import aclosing, nullcontext
 from dataclasses import dataclass, field
+from itertools import chain, repeat
 from typing import Any
 
 from .k8s_client import K8sClient, K8sPermissionError, K8sResourceNotFoundError
 from .platform_relationships import RESOURCE_RELATIONSHIPS
 
 
-@dataclass
+def _build_relationship_type_index() -> dict[tuple[str, str], str]:
+    """Flatten RESOURCE_RELATIONSHIPS into a (from_kind, to_kind) lookup."""
+    index: dict[tuple[str, str], str] = {}
+    for from_kind, relationships in RESOURCE_RELATIONSHIPS.items():
+        for rel_type, targets in relationships.items():
+            for to_kind in targets:
+                # The first relationship type listed for a pair takes precedence
+                index.setdefault((from_kind, to_kind), rel_type)
+    return index
+
+
+# Relationship type between two kinds, keyed by (from_kind, to_kind)
+_RELATIONSHIP_TYPE_INDEX = _build_relationship_type_index()
+
+# Platform kinds inferred for references without an explicit apiVersion and
+# kind, as (reference field, resource name hint, (api_version, kind)) entries
+# in precedence order
+_REFERENCE_KINDS: tuple[tuple[str, str, tuple[str, str]], ...] = (
+    ("githubProviderRef", "githubprovider", ("github.platform.kubecore.io/v1alpha1", "XGitHubProvider")),
+    ("githubProjectRef", "project", ("github.platform.kubecore.io/v1alpha1", "XGitHubProject")),
+    ("kubeClusterRef", "cluster", ("platform.kubecore.io/v1alpha1", "XKubeCluster")),
+    ("kubeNetRef", "network", ("network.platform.kubecore.io/v1alpha1", "XKubeNet")),
+    ("kubenvRef", "env", ("platform.kubecore.io/v1alpha1", "XKubEnv")),
+)
+
+# (api_version, kind) keyed by reference field name, singular and list form
+_FIELD_TO_GVK: dict[str | None, tuple[str, str]] = {
+    field_name: gvk
+    for ref_field, _, gvk in _REFERENCE_KINDS
+    for field_name in (ref_field, f"{ref_field}s")
+}
+
+# Matches a resource name against every name hint in one pass. Anchored
+# alternatives are tried in order, so the first listed hint found anywhere in
+# the name wins, and its group number indexes _NAME_HINT_GVKS.
+_NAME_HINT_PATTERN = re.compile(
+    "|".join(f".*?({re.escape(hint)})" for _, hint, _ in _REFERENCE_KINDS),
+    re.IGNORECASE | re.DOTALL,
+)
+_NAME_HINT_GVKS: tuple[tuple[str, str], ...] = tuple(gvk for _, _, gvk in _REFERENCE_KINDS)
+
+
+def _task_outcome(task: asyncio.Task) -> Any:
+    """Return a finished task's result, or the exception it raised."""
+    error = task.exception()
+    return task.result() if error is None else error
+
+
+def _maybe_ref(
+    api_version: str | None,
+    kind: str | None,
+    name: str | None,
+    namespace: str | None,
+) -> ResourceRef | None:
+    """Build a ResourceRef, or return None when any identifying field is empty."""
+    if not (api_version and kind and name):
+        return None
+    return ResourceRef(api_version=api_version, kind=kind, name=name, namespace=namespace)
+
+
+def _iter_entries(obj: dict[str, Any] | list[Any]) -> Iterator[tuple[str | None, Any]]:
+    """Iterate a dict's items, or a list's items paired with a None key."""
+    if isinstance(obj, dict):
+        return iter(obj.items())
+    return zip(repeat(None), obj)
+
+
+@dataclass(frozen=True, slots=True)
 class ResourceRef:
     """Represents a reference to a Kubernetes resource."""
 
@@ -25,15 +96,33 @@ class ResourceRef:
     kind: str
     name: str
     namespace: str | None = None
+    # Refs are keys of the cache and traversal sets, so the hash is computed once
+    _hash: int = field(init=False, repr=False, compare=False)
+    # Display string, built on first use since most refs are never printed
+    _display: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the hash of the immutable reference fields."""
+        object.__setattr__(
+            self, "_hash", hash((self.api_version, self.kind, self.name, self.namespace))
+        )
 
     def __str__(self) -> str:
         """String representation of the resource reference."""
-        ns_str = f"/{self.namespace}" if self.namespace else ""
-        return f"{self.kind}{ns_str}/{self.name}"
+        display = self._display
+        if display is None:
+            ns_str = f"/{self.namespace}" if self.namespace else ""
+            display = f"{self.kind}{ns_str}/{self.name}"
+            object.__setattr__(self, "_display", display)
+        return display
 
     def __hash__(self) -> int:
         """Hash for use in sets and dictionaries."""
-        return hash((self.api_version, self.kind, self.name, self.namespace))
+        return self._hash
+
+    def __reduce__(self) -> tuple[type[ResourceRef], tuple[str, str, str, str | None]]:
+        """Rebuild from the fields, since string hashes differ between processes."""
+        return ResourceRef, (self.api_version, self.kind, self.name, self.namespace)
 
 
 @dataclass
@@ -43,13 +132,14 @@ class ResolvedResource:
     ref: ResourceRef
     data: dict[str, Any]
     relationships: list[ResourceRef] = field(default_factory=list)
-    resolution_time: float = field(default_factory=time.time)
+    # time.monotonic() reading, immune to wall clock adjustments
+    resolution_time: float = field(default_factory=time.monotonic)
     cached: bool = False
 
     @property
     def age(self) -> float:
         """Age of the resolved resource in seconds."""
-        return time.time() - self.resolution_time
+        return time.monotonic() - self.resolution_time
 
 
 @dataclass
@@ -60,7 +150,6 @@ class ResolutionContext:
     max_resources: int = 100
     cache_ttl: float = 300.0  # 5 minutes
     visited: set[ResourceRef] = field(default_factory=set)
-    resolution_path: list[ResourceRef] = field(default_factory=list)
     resolved_count: int = 0
 
 
@@ -73,43 +162,90 @@ class ResourceResolutionError(Exception):
 
 
 class ResourceCache:
-    """Cache for resolved resources with TTL support."""
+    """LRU cache for resolved resources with TTL support.
+
+    Failed lookups (missing or forbidden resources) are remembered separately
+    for ``negative_ttl`` seconds, so dangling references are not refetched.
+    """
 
-    def __init__(self, ttl: float = 300.0):
-        """Initialize cache with TTL in seconds."""
+    def __init__(self, ttl: float = 300.0, max_size: int = 10_000, negative_ttl: float = 30.0):
+        """Initialize cache with TTLs in seconds and a maximum entry count."""
         self.ttl = ttl
-        self._cache: dict[ResourceRef, ResolvedResource] = {}
+        self.max_size = max_size
+        self.negative_ttl = negative_ttl
+        # Least recently used first; entries expire by their resolution time
+        self._cache: OrderedDict[ResourceRef, ResolvedResource] = OrderedDict()
+        # Failed lookups as (monotonic insert time, error message), oldest first
+        self._negative: OrderedDict[ResourceRef, tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
         self.logger = logging.getLogger(f"{__name__}.cache")
 
     def get(self, ref: ResourceRef) -> ResolvedResource | None:
         """Get a cached resource if it exists and is not expired."""
         resource = self._cache.get(ref)
-        if resource and resource.age < self.ttl:
-            self.logger.debug(f"Cache hit for {ref}")
+        if resource is None:
+            self.misses += 1
+            return None
+
+        if time.monotonic() - resource.resolution_time < self.ttl:
+            self._cache.move_to_end(ref)
+            self.hits += 1
+            self.logger.debug("Cache hit for %s", ref)
             return resource
-        elif resource:
-            # Remove expired entry
-            del self._cache[ref]
-            self.logger.debug(f"Cache expired for {ref}")
+
+        # Remove expired entry
+        del self._cache[ref]
+        self.misses += 1
+        self.logger.debug("Cache expired for %s", ref)
         return None
 
     def put(self, resource: ResolvedResource) -> None:
-        """Cache a resolved resource."""
+        """Cache a resolved resource, evicting the least recently used entry when full."""
         # Don't modify the original resource's cached flag
-        self._cache[resource.ref] = resource
-        self.logger.debug(f"Cached {resource.ref}")
+        ref = resource.ref
+        self._cache[ref] = resource
+        self._cache.move_to_end(ref)
+        if len(self._cache) > self.max_size:
+            evicted, _ = self._cache.popitem(last=False)
+            self.evictions += 1
+            self.logger.debug("Evicted %s from cache", evicted)
+        self.logger.debug("Cached %s", ref)
+
+    def get_negative(self, ref: ResourceRef) -> str | None:
+        """Get the error message of a recent failed lookup, if any."""
+        entry = self._negative.get(ref)
+        if entry is None:
+            return None
+
+        failed_at, message = entry
+        if time.monotonic() - failed_at < self.negative_ttl:
+            self.logger.debug("Negative cache hit for %s", ref)
+            return message
+
+        del self._negative[ref]
+        return None
+
+    def put_negative(self, ref: ResourceRef, message: str) -> None:
+        """Remember a failed lookup, evicting the oldest one when full."""
+        self._negative[ref] = (time.monotonic(), message)
+        self._negative.move_to_end(ref)
+        if len(self._negative) > self.max_size:
+            self._negative.popitem(last=False)
 
     def invalidate(self, ref: ResourceRef) -> None:
         """Invalidate a cached resource."""
-        if ref in self._cache:
-            del self._cache[ref]
-            self.logger.debug(f"Invalidated cache for {ref}")
+        self._negative.pop(ref, None)
+        if self._cache.pop(ref, None) is not None:
+            self.logger.debug("Invalidated cache for %s", ref)
 
     def clear(self) -> None:
         """Clear the entire cache."""
         count = len(self._cache)
         self._cache.clear()
-        self.logger.debug(f"Cleared cache ({count} entries)")
+        self._negative.clear()
+        self.logger.debug("Cleared cache (%d entries)", count)
 
     def size(self) -> int:
         """Get current cache size."""
@@ -124,6 +260,7 @@ class ResourceResolver:
         k8s_client: K8sClient,
         cache_ttl: float = 300.0,
         max_concurrent: int = 10,
+        negative_cache_ttl: float = 30.0,
     ):
         """Initialize the resource resolver.
         
@@ -131,13 +268,14 @@ class ResourceResolver:
             k8s_client: Kubernetes client for resource fetching
             cache_ttl: Cache time-to-live in seconds
             max_concurrent: Maximum concurrent resolution operations
+            negative_cache_ttl: Seconds to remember missing or forbidden resources
         """
         self.k8s_client = k8s_client
-        self.cache = ResourceCache(cache_ttl)
+        self.cache = ResourceCache(cache_ttl, negative_ttl=negative_cache_ttl)
         self.max_concurrent = max_concurrent
         self.logger = logging.getLogger(__name__)
         
-        self.logger.debug(f"ResourceResolver initialized with cache_ttl={cache_ttl}s, max_concurrent={max_concurrent}")
+        self.logger.debug("ResourceResolver initialized with cache_ttl=%ss, max_concurrent=%s", cache_ttl, max_concurrent)
 
         # Semaphore for controlling concurrent operations
         self._semaphore = asyncio.Semaphore(max_concurrent)
@@ -161,6 +299,15 @@ class ResourceResolver:
             CircularDependencyError: If circular dependency detected
             ResourceResolutionError: If resolution fails
         """
+        return await self._resolve_resource(ref, context, self._semaphore)
+
+    async def _resolve_resource(
+        self,
+        ref: ResourceRef,
+        context: ResolutionContext | None,
+        fetch_gate: asyncio.Semaphore | None,
+    ) -> ResolvedResource:
+        """Resolve a resource, holding ``fetch_gate`` (if any) around the API call."""
         if context is None:
             context = ResolutionContext()
 
@@ -170,65 +317,61 @@ class ResourceResolver:
             cached.cached = True  # Mark as cached when retrieved from cache
             return cached
 
+        # Fail fast on resources that were recently missing or forbidden
+        failure = self.cache.get_negative(ref)
+        if failure is not None:
+            raise ResourceResolutionError(failure)
+
         # Check for circular dependencies
         if ref in context.visited:
-            path_str = " -> ".join(str(r) for r in context.resolution_path + [ref])
             raise CircularDependencyError(
-                f"Circular dependency detected: {path_str}"
-            )
-
-        # Check resolution limits
-        if len(context.resolution_path) >= context.max_depth:
-            raise ResourceResolutionError(
-                f"Maximum resolution depth ({context.max_depth}) exceeded"
+                f"Circular dependency detected: {ref} was already resolved in this context"
             )
 
+        # Check resolution limits; depth is bounded by the traversal that owns
+        # the context (see resolve_with_relationships)
         if context.resolved_count >= context.max_resources:
             raise ResourceResolutionError(
                 f"Maximum resource count ({context.max_resources}) exceeded"
             )
 
-        # Add to visited set and resolution path
+        # Add to visited set
         context.visited.add(ref)
-        context.resolution_path.append(ref)
         context.resolved_count += 1
 
-        try:
-            async with self._semaphore:
-                # Fetch resource from Kubernetes
-                self.logger.debug(f"Resolving resource: {ref}")
-
-                try:
-                    data = await self.k8s_client.get_resource(
-                        ref.api_version,
-                        ref.kind,
-                        ref.name,
-                        ref.namespace,
-                    )
-                except K8sResourceNotFoundError:
-                    raise ResourceResolutionError(f"Resource not found: {ref}")
-                except K8sPermissionError:
-                    raise ResourceResolutionError(f"Permission denied for: {ref}")
-
-                # Create resolved resource
-                resolved = ResolvedResource(ref=ref, data=data)
-
-                # Find relationships in the resource
-                relationships = self._extract_relationships(resolved)
-                resolved.relationships = relationships
-
-                # Cache the resolved resource
-                self.cache.put(resolved)
-
-                self.logger.debug(
-                    f"Resolved {ref} with {len(relationships)} relationships"
+        async with fetch_gate or nullcontext():
+            # Fetch resource from Kubernetes
+            self.logger.debug("Resolving resource: %s", ref)
+
+            try:
+                data = await self.k8s_client.get_resource(
+                    ref.api_version,
+                    ref.kind,
+                    ref.name,
+                    ref.namespace,
                 )
+            except K8sResourceNotFoundError:
+                message = f"Resource not found: {ref}"
+                self.cache.put_negative(ref, message)
+                raise ResourceResolutionError(message)
+            except K8sPermissionError:
+                message = f"Permission denied for: {ref}"
+                self.cache.put_negative(ref, message)
+                raise ResourceResolutionError(message)
 
-                return resolved
+            # Create resolved resource
+            resolved = ResolvedResource(ref=ref, data=data)
 
-        finally:
-            # Clean up context
-            context.resolution_path.pop()
+            # Find relationships in the resource
+            relationships = self._extract_relationships(resolved)
+            resolved.relationships = relationships
+
+            # Cache the resolved resource
+            self.cache.put(resolved)
+
+            self.logger.debug("Resolved %s with %d relationships", ref, len(relationships))
+
+            return resolved
 
     async def resolve_with_relationships(
         self,
@@ -241,7 +384,7 @@ class ResourceResolver:
         
         Args:
             ref: Root resource reference to resolve
-            max_depth: Maximum depth for relationship traversal
+            max_depth: Maximum number of relationship hops followed from the root
             max_resources: Maximum number of resources to resolve
             relationship_types: Set of relationship types to follow
             
@@ -262,37 +405,99 @@ class ResourceResolver:
 
         resolved_resources: dict[ResourceRef, ResolvedResource] = {}
         pending_refs: deque[ResourceRef] = deque([ref])
+        # Depth of every ref ever queued (the root is 0), so a ref is attempted
+        # at most once and relationships stop max_depth hops from the root
+        queued: dict[ResourceRef, int] = {ref: 0}
 
         while pending_refs and context.resolved_count < max_resources:
-            current_ref = pending_refs.popleft()
+            # Resolve the current layer in parallel, within the remaining budget
+            batch_size = min(len(pending_refs), max_resources - context.resolved_count)
+            batch = [pending_refs.popleft() for _ in range(batch_size)]
+
+            async with aclosing(self.resolve_parallel_iter(batch, context=context)) as results:
+                async for current_ref, resolved in results:
+                    if isinstance(resolved, (CircularDependencyError, ResourceResolutionError)):
+                        self.logger.warning("Failed to resolve %s: %s", current_ref, resolved)
+                        # Continue with other resources rather than failing completely
+                        continue
+                    if isinstance(resolved, BaseException):
+                        raise resolved
+
+                    resolved_resources[current_ref] = resolved
+
+                    depth = queued[current_ref]
+                    if depth >= context.max_depth:
+                        continue
+
+                    # Queue related resources for the next layer
+                    for rel_ref in resolved.relationships:
+                        if rel_ref not in queued:
+                            # Check if we should follow this relationship type
+                            rel_type = self._get_relationship_type(current_ref, rel_ref)
+                            if rel_type and rel_type in relationship_types:
+                                pending_refs.append(rel_ref)
+                                queued[rel_ref] = depth + 1
+
+        self.logger.info("Resolved %d resources starting from %s", len(resolved_resources), ref)
 
-            # Skip if already resolved
-            if current_ref in resolved_resources:
-                continue
+        return resolved_resources
 
-            try:
-                # Resolve current resource
-                resolved = await self.resolve_resource(current_ref, context)
-                resolved_resources[current_ref] = resolved
-
-                # Add related resources to pending queue
-                for rel_ref in resolved.relationships:
-                    if rel_ref not in resolved_resources and rel_ref not in pending_refs:
-                        # Check if we should follow this relationship type
-                        rel_type = self._get_relationship_type(current_ref, rel_ref)
-                        if rel_type and rel_type in relationship_types:
-                            pending_refs.append(rel_ref)
-
-            except (CircularDependencyError, ResourceResolutionError) as e:
-                self.logger.warning(f"Failed to resolve {current_ref}: {e}")
-                # Continue with other resources rather than failing completely
-                continue
+    async def resolve_parallel_iter(
+        self,
+        refs: Iterable[ResourceRef],
+        max_concurrent: int | None = None,
+        context: ResolutionContext | None = None,
+    ) -> AsyncIterator[tuple[ResourceRef, ResolvedResource | Exception]]:
+        """Resolve multiple resources in parallel, yielding each as it finishes.
 
-        self.logger.info(
-            f"Resolved {len(resolved_resources)} resources starting from {ref}"
-        )
+        Args:
+            refs: Resource references to resolve; duplicates are resolved once
+            max_concurrent: Override max concurrent operations
+            context: Resolution context shared by all resolutions
 
-        return resolved_resources
+        Yields:
+            (ref, resolved resource or exception) pairs in completion order
+        """
+        # By default each task holds a slot of the resolver-wide semaphore, so
+        # the global limit also covers concurrent callers. An override gets its
+        # own semaphore, and fetches still pass through the global one.
+        if max_concurrent is None:
+            semaphore = self._semaphore
+            fetch_gate = None
+        else:
+            semaphore = asyncio.Semaphore(max_concurrent)
+            fetch_gate = self._semaphore
+        finished: asyncio.Queue[asyncio.Task] = asyncio.Queue()
+
+        def on_done(task: asyncio.Task) -> None:
+            semaphore.release()
+            finished.put_nowait(task)
+
+        # Acquire a slot before creating each task, so at most max_concurrent
+        # tasks exist at a time however many refs are passed in
+        pending: dict[asyncio.Task, ResourceRef] = {}
+        started: set[ResourceRef] = set()
+        try:
+            for ref in refs:
+                if ref in started:
+                    continue
+                started.add(ref)
+                await semaphore.acquire()
+                task = asyncio.create_task(self._resolve_resource(ref, context, fetch_gate))
+                task.add_done_callback(on_done)
+                pending[task] = ref
+
+                # Hand out whatever finished while waiting for a slot
+                while not finished.empty():
+                    task = finished.get_nowait()
+                    yield pending.pop(task), _task_outcome(task)
+
+            while pending:
+                task = await finished.get()
+                yield pending.pop(task), _task_outcome(task)
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def resolve_parallel(
         self,
@@ -308,40 +513,19 @@ class ResourceResolver:
         Returns:
             Dictionary mapping refs to resolved resources or exceptions
         """
-        if max_concurrent is None:
-            max_concurrent = self.max_concurrent
-
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def resolve_one(ref: ResourceRef) -> tuple[ResourceRef, ResolvedResource | Exception]:
-            async with semaphore:
-                try:
-                    result = await self.resolve_resource(ref)
-                    return ref, result
-                except Exception as e:
-                    return ref, e
-
-        # Execute all resolutions concurrently
-        tasks = [resolve_one(ref) for ref in refs]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Convert results to dictionary
-        result_dict: dict[ResourceRef, ResolvedResource | Exception] = {}
-        for result in results:
-            if isinstance(result, Exception):
-                self.logger.error(f"Task failed: {result}")
-                continue
-            ref, resolved_or_exception = result
-            result_dict[ref] = resolved_or_exception
-
-        success_count = sum(
-            1 for r in result_dict.values()
-            if isinstance(r, ResolvedResource)
-        )
+        result_dict: dict[ResourceRef, ResolvedResource | Exception] = {
+            ref: result
+            async for ref, result in self.resolve_parallel_iter(refs, max_concurrent)
+        }
 
-        self.logger.info(
-            f"Parallel resolution completed: {success_count}/{len(refs)} successful"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            success_count = sum(
+                1 for r in result_dict.values()
+                if isinstance(r, ResolvedResource)
+            )
+            self.logger.info(
+                "Parallel resolution completed: %d/%d successful", success_count, len(refs)
+            )
 
         return result_dict
 
@@ -352,77 +536,84 @@ class ResourceResolver:
         and extracts them as ResourceRef objects.
         """
         relationships: list[ResourceRef] = []
+        seen: set[ResourceRef] = set()
         data = resource.data
-
-        # Extract references from spec section
-        spec = data.get("spec", {})
-        relationships.extend(self._extract_refs_from_object(spec, resource.ref.namespace))
-
-        # Extract references from status section (for observed state)
-        status = data.get("status", {})
-        relationships.extend(self._extract_refs_from_object(status, resource.ref.namespace))
+        namespace = resource.ref.namespace
 
         # Extract references from metadata (owner references, etc.)
-        metadata = data.get("metadata", {})
-        owner_refs = metadata.get("ownerReferences", [])
-        for owner_ref in owner_refs:
-            if isinstance(owner_ref, dict) and owner_ref.get("name") and owner_ref.get("kind"):
-                relationships.append(ResourceRef(
-                    api_version=owner_ref.get("apiVersion", "v1"),
-                    kind=owner_ref.get("kind", ""),
-                    name=owner_ref.get("name", ""),
-                    namespace=resource.ref.namespace,  # Same namespace as owner
-                ))
-
-        # Remove duplicates and invalid refs
-        unique_refs = []
-        seen = set()
-        for ref in relationships:
-            if ref not in seen and ref.name and ref.kind and ref.api_version:
-                unique_refs.append(ref)
+        owner_refs = (
+            _maybe_ref(
+                owner_ref.get("apiVersion", "v1"),
+                owner_ref.get("kind"),
+                owner_ref.get("name"),
+                namespace,  # Same namespace as owner
+            )
+            for owner_ref in data.get("metadata", {}).get("ownerReferences", [])
+            if isinstance(owner_ref, dict)
+        )
+
+        # References from spec, status (for observed state) and owners
+        for ref in chain(
+            self._extract_refs_from_object(data.get("spec", {}), namespace),
+            self._extract_refs_from_object(data.get("status", {}), namespace),
+            owner_refs,
+        ):
+            if ref is not None and ref not in seen:
                 seen.add(ref)
+                relationships.append(ref)
 
-        return unique_refs
+        return relationships
 
     def _extract_refs_from_object(
         self,
         obj: Any,
         default_namespace: str | None = None,
-    ) -> list[ResourceRef]:
-        """Recursively extract resource references from an object."""
-        refs: list[ResourceRef] = []
-
-        if isinstance(obj, dict):
-            # Look for common reference patterns
-            for key, value in obj.items():
-                if key.endswith("Ref") and isinstance(value, dict):
-                    # Standard Kubernetes reference
-                    ref = self._parse_object_reference(value, default_namespace)
-                    if ref:
-                        refs.append(ref)
+    ) -> Iterator[ResourceRef]:
+        """Yield resource references from an object and everything nested in it."""
+        if not isinstance(obj, (dict, list)):
+            return
+
+        parse_reference = self._parse_object_reference
+
+        # Depth-first walk with an explicit stack of (key, value) iterators,
+        # visiting entries in the same order as a recursive walk would
+        stack = [_iter_entries(obj)]
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            key, value = entry
+            if key is not None:
+                # Look for common reference patterns
+                if key.endswith("Ref"):
+                    if isinstance(value, dict):
+                        # Standard Kubernetes reference
+                        ref = parse_reference(value, default_namespace, key)
+                        if ref:
+                            yield ref
+                        continue
                 elif key.endswith("Refs") and isinstance(value, list):
                     # List of references
                     for item in value:
                         if isinstance(item, dict):
-                            ref = self._parse_object_reference(item, default_namespace)
+                            ref = parse_reference(item, default_namespace, key)
                             if ref:
-                                refs.append(ref)
-                elif isinstance(value, (dict, list)):
-                    # Recurse into nested objects/arrays
-                    refs.extend(self._extract_refs_from_object(value, default_namespace))
+                                yield ref
+                    continue
 
-        elif isinstance(obj, list):
-            for item in obj:
-                refs.extend(self._extract_refs_from_object(item, default_namespace))
-
-        return refs
+            if isinstance(value, (dict, list)):
+                # Descend into nested objects/arrays
+                stack.append(_iter_entries(value))
 
     def _parse_object_reference(
         self,
         ref_obj: dict[str, Any],
         default_namespace: str | None = None,
+        field_name: str | None = None,
     ) -> ResourceRef | None:
-        """Parse a Kubernetes object reference."""
+        """Parse a Kubernetes object reference found under ``field_name``."""
         name = ref_obj.get("name")
         if not name:
             return None
@@ -431,37 +622,22 @@ class ResourceResolver:
         api_version = ref_obj.get("apiVersion")
         kind = ref_obj.get("kind")
 
-        # If not explicitly specified, try to infer from reference field names
+        # If not explicitly specified, infer from the reference field name,
+        # then from the resource name
         if not api_version or not kind:
-            # Look for common KubeCore platform references
-            if "githubProviderRef" in str(ref_obj) or "githubProvider" in name.lower():
-                api_version = "github.platform.kubecore.io/v1alpha1"
-                kind = "XGitHubProvider"
-            elif "githubProjectRef" in str(ref_obj) or "project" in name.lower():
-                api_version = "github.platform.kubecore.io/v1alpha1"
-                kind = "XGitHubProject"
-            elif "kubeClusterRef" in str(ref_obj) or "cluster" in name.lower():
-                api_version = "platform.kubecore.io/v1alpha1"
-                kind = "XKubeCluster"
-            elif "kubeNetRef" in str(ref_obj) or "network" in name.lower():
-                api_version = "network.platform.kubecore.io/v1alpha1"
-                kind = "XKubeNet"
-            elif "kubenvRef" in str(ref_obj) or "env" in name.lower():
-                api_version = "platform.kubecore.io/v1alpha1"
-                kind = "XKubEnv"
+            gvk = _FIELD_TO_GVK.get(field_name)
+            if gvk is None:
+                match = _NAME_HINT_PATTERN.match(name)
+                if match:
+                    gvk = _NAME_HINT_GVKS[match.lastindex - 1]
+            if gvk is not None:
+                api_version, kind = gvk
             else:
                 # Default fallback
                 api_version = api_version or "v1"
                 kind = kind or "ConfigMap"
 
-        namespace = ref_obj.get("namespace", default_namespace)
-
-        return ResourceRef(
-            api_version=api_version,
-            kind=kind,
-            name=name,
-            namespace=namespace,
-        )
+        return _maybe_ref(api_version, kind, name, ref_obj.get("namespace", default_namespace))
 
     def _get_relationship_type(
         self,
@@ -469,13 +645,7 @@ class ResourceResolver:
         to_ref: ResourceRef,
     ) -> str | None:
         """Get the relationship type between two resources."""
-        from_relationships = RESOURCE_RELATIONSHIPS.get(from_ref.kind, {})
-
-        for rel_type, targets in from_relationships.items():
-            if to_ref.kind in targets:
-                return rel_type
-
-        return None
+        return _RELATIONSHIP_TYPE_INDEX.get((from_ref.kind, to_ref.kind))
 
     def detect_circular_dependencies(
         self,
@@ -488,43 +658,56 @@ class ResourceResolver:
         cycles: list[list[ResourceRef]] = []
         visited: set[ResourceRef] = set()
         path: list[ResourceRef] = []
+        # Position of each ref currently on the path, doubling as the in-stack set
+        path_index: dict[ResourceRef, int] = {}
+
+        # Iterative DFS, so deep relationship chains cannot hit the recursion limit
+        for root in resolved_resources:
+            if root in visited:
+                continue
 
-        def dfs(ref: ResourceRef) -> None:
-            if ref in path:
-                # Found a cycle
-                cycle_start = path.index(ref)
-                cycle = path[cycle_start:] + [ref]
-                cycles.append(cycle)
-                return
+            visited.add(root)
+            path_index[root] = 0
+            path.append(root)
+            stack = [iter(resolved_resources[root].relationships)]
 
-            if ref in visited:
-                return
+            while stack:
+                rel_ref = next(stack[-1], None)
+                if rel_ref is None:
+                    # All relationships followed, backtrack
+                    stack.pop()
+                    del path_index[path.pop()]
+                    continue
 
-            visited.add(ref)
-            path.append(ref)
+                if rel_ref not in resolved_resources:
+                    continue
 
-            # Follow relationships
-            resolved = resolved_resources.get(ref)
-            if resolved:
-                for rel_ref in resolved.relationships:
-                    if rel_ref in resolved_resources:
-                        dfs(rel_ref)
+                cycle_start = path_index.get(rel_ref)
+                if cycle_start is not None:
+                    # Found a cycle
+                    cycles.append(path[cycle_start:] + [rel_ref])
+                    continue
 
-            path.pop()
+                if rel_ref in visited:
+                    continue
 
-        # Check all resources
-        for ref in resolved_resources:
-            if ref not in visited:
-                dfs(ref)
+                visited.add(rel_ref)
+                path_index[rel_ref] = len(path)
+                path.append(rel_ref)
+                stack.append(iter(resolved_resources[rel_ref].relationships))
 
         return cycles
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
+        cache = self.cache
         return {
-            "size": self.cache.size(),
-            "ttl": self.cache.ttl,
-            "hit_rate": getattr(self.cache, "_hit_count", 0) / max(getattr(self.cache, "_access_count", 1), 1),
+            "size": cache.size(),
+            "ttl": cache.ttl,
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "evictions": cache.evictions,
+            "hit_rate": cache.hits / max(cache.hits + cache.misses, 1),
         }
 
     def clear_cache(self) -> None:
@@ -7,22 +7,26 @@ specifications and provides optimized summaries for context resolution.
 from __future__ import annotations
 
 import logging
+import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from typing import Any
 
 from .resource_resolver import ResolvedResource, ResourceRef
 from .schema_registry import ResourceSchema, SchemaRegistry
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSummary:
     """Summary of a Kubernetes resource with key attributes."""
 
     ref: ResourceRef
     summary: dict[str, Any] = field(default_factory=dict)
     metadata: dict[str, Any] = field(default_factory=dict)
-    relationships: list[ResourceRef] = field(default_factory=list)
+    relationships: tuple[ResourceRef, ...] = ()
     extraction_time: float = field(default_factory=time.time)
     schema_version: str = ""
 
@@ -32,7 +36,7 @@ class ResourceSummary:
         return time.time() - self.extraction_time
 
 
-@dataclass
+@dataclass(slots=True)
 class SummarizationConfig:
     """Configuration for resource summarization."""
 
@@ -54,6 +58,131 @@ class SummarizationConfig:
     include_relationships: bool = True
     include_status: bool = False
 
+    # Summary cache bounds
+    summary_cache_ttl: float = 300.0  # 5 minutes
+    summary_cache_max: int = 1000
+
+
+# Priority fields always kept when extracting without a schema
+_PRIORITY_FIELDS: frozenset[str] = frozenset({
+    "name", "namespace", "type", "image", "port", "version",
+    "region", "credentials", "organization", "baseUrl",
+    "environmentType", "components", "key", "description",
+    "appName", "visibility"
+})
+
+# Metadata fields copied into every summary
+_METADATA_FIELDS = (
+    "name", "namespace", "creationTimestamp", "generation",
+    "resourceVersion", "uid", "labels", "annotations"
+)
+
+# Owner reference fields kept in summary metadata
+_OWNER_REFERENCE_FIELDS = ("apiVersion", "kind", "name")
+_get_owner_reference_fields = itemgetter(*_OWNER_REFERENCE_FIELDS)
+
+
+def _project_owner_reference(ref: dict[str, Any]) -> dict[str, Any]:
+    """Project an owner reference onto its apiVersion, kind and name."""
+    try:
+        return dict(zip(_OWNER_REFERENCE_FIELDS, _get_owner_reference_fields(ref), strict=True))
+    except KeyError:
+        # Incomplete owner references keep None for missing fields
+        return {key: ref.get(key) for key in _OWNER_REFERENCE_FIELDS}
+
+
+# Leaf types returned unchanged by _sanitize_value
+_PASSTHROUGH_TYPES = frozenset({int, float, bool, type(None)})
+
+# Field kinds of a compiled extraction plan
+_SCALAR = 0
+_OBJECT = 1
+_ARRAY = 2
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldPlan:
+    """Precompiled extraction step for one schema property."""
+
+    name: str
+    # Position in the schema, used to keep output order when selecting fields
+    position: int
+    kind: int = _SCALAR
+    # Nested properties of an object field; empty means sanitize the value whole
+    properties: dict[str, _FieldPlan] = field(default_factory=dict)
+    # Array items: _OBJECT items use item_properties, or key fields when empty
+    item_kind: int = _SCALAR
+    item_properties: dict[str, _FieldPlan] = field(default_factory=dict)
+    has_default: bool = False
+    default: Any = None
+
+
+_plan_position = attrgetter("position")
+
+
+def _compile_plan(schema_properties: dict[str, Any]) -> dict[str, _FieldPlan]:
+    """Compile OpenAPI properties into extraction steps keyed by field name."""
+    plan: dict[str, _FieldPlan] = {}
+    for position, (property_name, field_schema) in enumerate(schema_properties.items()):
+        field_name = sys.intern(property_name)
+        field_type = field_schema.get("type", "string")
+        has_default = "default" in field_schema
+        default = field_schema.get("default")
+
+        if field_type == "object":
+            plan[field_name] = _FieldPlan(
+                field_name,
+                position,
+                _OBJECT,
+                properties=_compile_plan(field_schema.get("properties", {})),
+                has_default=has_default,
+                default=default,
+            )
+        elif field_type == "array":
+            item_schema = field_schema.get("items", {})
+            item_is_object = item_schema.get("type", "string") == "object"
+            plan[field_name] = _FieldPlan(
+                field_name,
+                position,
+                _ARRAY,
+                item_kind=_OBJECT if item_is_object else _SCALAR,
+                item_properties=(
+                    _compile_plan(item_schema.get("properties", {})) if item_is_object else {}
+                ),
+                has_default=has_default,
+                default=default,
+            )
+        else:
+            plan[field_name] = _FieldPlan(
+                field_name, position, has_default=has_default, default=default
+            )
+    return plan
+
+
+# Relationship inference rules as (from kind substring, to kind substring,
+# relationship type); the first match wins and an empty substring matches any kind
+_RELATIONSHIP_RULES = (
+    ("cluster", "net", "uses"),
+    ("app", "env", "deploysTo"),
+    ("env", "cluster", "runsOn"),
+    ("project", "", "owns"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _infer_relationship(from_kind: str, to_kind: str) -> str:
+    """Infer the relationship type between two resource kinds.
+
+    There are few distinct kind pairs, so results are memoized.
+    """
+    from_kind = from_kind.lower()
+    to_kind = to_kind.lower()
+
+    for from_hint, to_hint, relationship_type in _RELATIONSHIP_RULES:
+        if from_hint in from_kind and to_hint in to_kind:
+            return relationship_type
+    return "references"
+
 
 class ResourceSummarizer:
     """Engine for extracting and summarizing resource attributes."""
@@ -75,32 +204,45 @@ class ResourceSummarizer:
 
         # Cache for schemas and summaries
         self._schema_cache: dict[str, ResourceSchema] = {}
-        self._summary_cache: dict[ResourceRef, ResourceSummary] = {}
+        # Compiled extraction plans keyed by (kind, "spec" | "status")
+        self._plan_cache: dict[tuple[str, str], dict[str, _FieldPlan]] = {}
+        # Bounded LRU of (monotonic insert time, summary), least recently used first
+        self._summary_cache: OrderedDict[ResourceRef, tuple[float, ResourceSummary]] = OrderedDict()
 
     def summarize_resource(
         self,
         resolved: ResolvedResource,
         requested_fields: set[str] | None = None,
+        now: float | None = None,
+        schema: ResourceSchema | None = None,
     ) -> ResourceSummary:
         """Summarize a resolved resource based on its schema.
         
         Args:
             resolved: Resolved resource to summarize
             requested_fields: Specific fields to include in summary
+            now: Extraction timestamp to record, shared across a batch
+            schema: Pre-resolved schema for the resource kind
             
         Returns:
             Resource summary with extracted key attributes
         """
         # Check cache first
-        if self.config.cache_summaries:
-            cached = self._summary_cache.get(resolved.ref)
-            if cached and cached.age < 300:  # 5 minutes cache
-                return cached
+        cache_summaries = self.config.cache_summaries
+        if cache_summaries:
+            entry = self._summary_cache.get(resolved.ref)
+            if entry is not None:
+                cached_at, cached = entry
+                if time.monotonic() - cached_at < self.config.summary_cache_ttl:
+                    self._summary_cache.move_to_end(resolved.ref)
+                    return cached
+                del self._summary_cache[resolved.ref]
 
         self.logger.debug(f"Summarizing resource: {resolved.ref}")
 
         # Get schema for the resource
-        schema = self._get_resource_schema(resolved.ref.kind)
+        if schema is None:
+            schema = self._get_resource_schema(resolved.ref.kind)
 
         # Extract summary based on schema
         summary_data = self._extract_summary_data(
@@ -117,13 +259,18 @@ class ResourceSummarizer:
             ref=resolved.ref,
             summary=summary_data,
             metadata=metadata,
-            relationships=resolved.relationships.copy(),
+            relationships=tuple(resolved.relationships),
+            extraction_time=time.time() if now is None else now,
             schema_version=schema.api_version if schema else "",
         )
 
-        # Cache the summary
-        if self.config.cache_summaries:
-            self._summary_cache[resolved.ref] = summary
+        # Cache the summary, evicting the least recently used one when full
+        if cache_summaries:
+            summary_cache = self._summary_cache
+            summary_cache[resolved.ref] = (time.monotonic(), summary)
+            summary_cache.move_to_end(resolved.ref)
+            if len(summary_cache) > self.config.summary_cache_max:
+                summary_cache.popitem(last=False)
 
         self.logger.debug(
             f"Summarized {resolved.ref}: {len(summary_data)} fields, "
@@ -148,14 +295,24 @@ class ResourceSummarizer:
         """
         summaries: dict[ResourceRef, ResourceSummary] = {}
 
+        # One timestamp and one schema lookup per kind for the whole batch
+        now = time.time()
+        schemas: dict[str, ResourceSchema | None] = {}
+
         for ref, resolved in resolved_resources.items():
             try:
                 # Get requested fields for this resource kind
+                kind = ref.kind
                 fields = None
                 if requested_fields:
-                    fields = requested_fields.get(ref.kind)
+                    fields = requested_fields.get(kind)
+
+                if kind in schemas:
+                    schema = schemas[kind]
+                else:
+                    schema = schemas[kind] = self._get_resource_schema(kind)
 
-                summary = self.summarize_resource(resolved, fields)
+                summary = self.summarize_resource(resolved, fields, now, schema)
                 summaries[ref] = summary
 
             except Exception as e:
@@ -165,6 +322,7 @@ class ResourceSummarizer:
                     ref=ref,
                     summary={"error": str(e)},
                     metadata={"summarization_failed": True},
+                    extraction_time=now,
                 )
 
         self.logger.info(f"Summarized {len(summaries)} resources")
@@ -172,15 +330,25 @@ class ResourceSummarizer:
 
     def _get_resource_schema(self, kind: str) -> ResourceSchema | None:
         """Get schema for a resource kind with caching."""
-        if kind in self._schema_cache:
-            return self._schema_cache[kind]
+        schema = self._schema_cache.get(kind)
+        if schema is not None:
+            return schema
 
         schema = self.schema_registry.get_schema_info(kind)
         if schema:
-            self._schema_cache[kind] = schema
+            self._schema_cache[sys.intern(kind)] = schema
 
         return schema
 
+    def _get_extraction_plan(self, schema: ResourceSchema, section: str) -> dict[str, _FieldPlan]:
+        """Get the compiled extraction plan for a schema section with caching."""
+        key = (schema.kind, section)
+        plan = self._plan_cache.get(key)
+        if plan is None:
+            section_schema = schema.schema.get("properties", {}).get(section, {})
+            plan = self._plan_cache[key] = _compile_plan(section_schema.get("properties", {}))
+        return plan
+
     def _extract_summary_data(
         self,
         resource_data: dict[str, Any],
@@ -194,16 +362,12 @@ class ResourceSummarizer:
             # Extract without schema guidance
             return self._extract_without_schema(resource_data, requested_fields)
 
-        # Extract based on schema
-        schema_properties = schema.schema.get("properties", {})
-        spec_properties = schema_properties.get("spec", {}).get("properties", {})
-
         # Extract spec fields
         spec_data = resource_data.get("spec", {})
         if spec_data:
             summary["spec"] = self._extract_fields_by_schema(
                 spec_data,
-                spec_properties,
+                self._get_extraction_plan(schema, "spec"),
                 requested_fields,
                 depth=0,
             )
@@ -211,11 +375,11 @@ class ResourceSummarizer:
         # Extract status if configured
         if self.config.include_status:
             status_data = resource_data.get("status", {})
-            status_properties = schema_properties.get("status", {}).get("properties", {})
-            if status_data and status_properties:
+            status_plan = self._get_extraction_plan(schema, "status")
+            if status_data and status_plan:
                 summary["status"] = self._extract_fields_by_schema(
                     status_data,
-                    status_properties,
+                    status_plan,
                     requested_fields,
                     depth=0,
                 )
@@ -230,75 +394,94 @@ class ResourceSummarizer:
         """Extract summary data without schema guidance."""
         summary: dict[str, Any] = {}
 
-        # Extract key sections
-        sections_to_extract = ["spec"]
-        if self.config.include_status:
-            sections_to_extract.append("status")
+        # Extract key sections in one pass over a shared work stack
+        sections_to_extract = ("spec", "status") if self.config.include_status else ("spec",)
+        stack = []
 
         for section in sections_to_extract:
             section_data = resource_data.get(section, {})
             if section_data:
-                summary[section] = self._extract_key_fields(
-                    section_data,
-                    requested_fields,
-                    depth=0,
-                )
+                extracted = summary[section] = {}
+                stack.append((extracted, section_data, 0))
+
+        if self.config.max_depth > 0:
+            self._fill_key_fields(stack, requested_fields)
 
         return summary
 
     def _extract_fields_by_schema(
         self,
         data: dict[str, Any],
-        schema_properties: dict[str, Any],
+        plan: dict[str, _FieldPlan],
         requested_fields: set[str] | None = None,
         depth: int = 0,
     ) -> dict[str, Any]:
-        """Extract fields based on schema properties."""
-        if depth >= self.config.max_depth:
+        """Extract fields following a compiled schema plan."""
+        max_depth = self.config.max_depth
+        if depth >= max_depth:
             return {}
 
+        include_defaults = self.config.include_defaults
         extracted: dict[str, Any] = {}
 
-        for field_name, field_schema in schema_properties.items():
-            # Skip if not in requested fields
-            if requested_fields and field_name not in requested_fields:
-                continue
-
-            field_value = data.get(field_name)
-
-            # Handle missing fields
-            if field_value is None:
-                if self.config.include_defaults and "default" in field_schema:
-                    extracted[field_name] = field_schema["default"]
-                continue
-
-            # Extract based on field type
-            field_type = field_schema.get("type", "string")
-
-            if field_type == "object":
-                # Recursively extract object fields
-                nested_properties = field_schema.get("properties", {})
-                if nested_properties and isinstance(field_value, dict):
-                    extracted[field_name] = self._extract_fields_by_schema(
+        # Nested objects are queued as (destination, source, plan, depth)
+        # instead of recursing, so deep specs cost no extra Python frames
+        stack = [(extracted, data, plan, depth)]
+        while stack:
+            dst, src, src_plan, level = stack.pop()
+
+            # Visit only requested fields that exist in the schema, in schema order
+            if not requested_fields:
+                field_plans = src_plan.values()
+            elif len(requested_fields) < len(src_plan):
+                field_plans = sorted(
+                    (src_plan[name] for name in requested_fields if name in src_plan),
+                    key=_plan_position,
+                )
+            else:
+                field_plans = [
+                    field_plan for name, field_plan in src_plan.items()
+                    if name in requested_fields
+                ]
+
+            for field_plan in field_plans:
+                field_name = field_plan.name
+
+                # Schema defaults only fill fields that are truly missing
+                try:
+                    field_value = src[field_name]
+                except KeyError:
+                    if include_defaults and field_plan.has_default:
+                        dst[field_name] = field_plan.default
+                    continue
+
+                if field_value is None:
+                    continue
+
+                # Extract based on field type
+                field_kind = field_plan.kind
+
+                if field_kind == _OBJECT:
+                    # Queue nested object fields
+                    if field_plan.properties and isinstance(field_value, dict):
+                        nested = dst[field_name] = {}
+                        if level + 1 < max_depth:
+                            stack.append((nested, field_value, field_plan.properties, level + 1))
+                    else:
+                        dst[field_name] = self._sanitize_value(field_value)
+
+                elif field_kind == _ARRAY:
+                    # Handle arrays with item schemas
+                    dst[field_name] = self._extract_array_items(
                         field_value,
-                        nested_properties,
-                        requested_fields,
-                        depth + 1,
+                        field_plan.item_kind,
+                        field_plan.item_properties,
+                        level,
                     )
-                else:
-                    extracted[field_name] = self._sanitize_value(field_value)
-
-            elif field_type == "array":
-                # Handle arrays with item schemas
-                extracted[field_name] = self._extract_array_items(
-                    field_value,
-                    field_schema.get("items", {}),
-                    depth,
-                )
 
-            else:
-                # Simple field types
-                extracted[field_name] = self._sanitize_value(field_value)
+                else:
+                    # Simple field types
+                    dst[field_name] = self._sanitize_value(field_value)
 
         return extracted
 
@@ -313,46 +496,55 @@ class ResourceSummarizer:
             return {}
 
         extracted: dict[str, Any] = {}
+        self._fill_key_fields([(extracted, data, depth)], requested_fields)
+        return extracted
 
-        # Priority fields to always include
-        priority_fields = {
-            "name", "namespace", "type", "image", "port", "version",
-            "region", "credentials", "organization", "baseUrl",
-            "environmentType", "components", "key", "description",
-            "appName", "visibility"
-        }
+    def _fill_key_fields(
+        self,
+        stack: list[tuple[dict[str, Any], dict[str, Any], int]],
+        requested_fields: set[str] | None,
+    ) -> None:
+        """Fill queued (destination, source, depth) key field extractions."""
+        max_depth = self.config.max_depth
+
+        # All fields without a request, otherwise only requested priority fields
+        if requested_fields is None:
+            allowed = None
+        elif requested_fields:
+            allowed = _PRIORITY_FIELDS.intersection(requested_fields)
+        else:
+            allowed = _PRIORITY_FIELDS
+
+        # Nested objects are queued instead of recursing
+        while stack:
+            dst, src, level = stack.pop()
 
-        for field_name, field_value in data.items():
-            # Skip if not in requested fields (when specified)
-            if requested_fields and field_name not in requested_fields:
-                continue
+            for field_name, field_value in src.items():
+                if allowed is not None and field_name not in allowed:
+                    continue
 
-            # Always include priority fields
-            if field_name in priority_fields or requested_fields is None:
                 if isinstance(field_value, dict):
-                    # Recursively extract nested objects
-                    extracted[field_name] = self._extract_key_fields(
-                        field_value,
-                        requested_fields,
-                        depth + 1,
-                    )
+                    # Queue nested objects
+                    nested = dst[field_name] = {}
+                    if level + 1 < max_depth:
+                        stack.append((nested, field_value, level + 1))
                 elif isinstance(field_value, list):
                     # Handle arrays
-                    extracted[field_name] = self._extract_array_items(
+                    dst[field_name] = self._extract_array_items(
                         field_value,
+                        _SCALAR,
                         {},
-                        depth,
+                        level,
                     )
                 else:
                     # Simple values
-                    extracted[field_name] = self._sanitize_value(field_value)
-
-        return extracted
+                    dst[field_name] = self._sanitize_value(field_value)
 
     def _extract_array_items(
         self,
         array_value: list[Any],
-        item_schema: dict[str, Any],
+        item_kind: int,
+        item_properties: dict[str, _FieldPlan],
         depth: int,
     ) -> list[Any]:
         """Extract and summarize array items."""
@@ -364,12 +556,10 @@ class ResourceSummarizer:
         limited_array = array_value[:max_items]
 
         extracted_items = []
-        item_type = item_schema.get("type", "string")
 
         for item in limited_array:
-            if item_type == "object" and isinstance(item, dict):
+            if item_kind == _OBJECT and isinstance(item, dict):
                 # Extract object properties
-                item_properties = item_schema.get("properties", {})
                 if item_properties:
                     extracted_item = self._extract_fields_by_schema(
                         item,
@@ -392,23 +582,27 @@ class ResourceSummarizer:
 
     def _sanitize_value(self, value: Any) -> Any:
         """Sanitize a value for inclusion in summary."""
-        if isinstance(value, str):
+        # Exact-type fast path for the common leaf values
+        value_type = type(value)
+        if value_type in _PASSTHROUGH_TYPES:
+            return value
+
+        max_length = self.config.max_string_length
+
+        if value_type is str or isinstance(value, str):
             # Truncate long strings
-            if len(value) > self.config.max_string_length:
-                return value[:self.config.max_string_length] + "..."
+            if len(value) > max_length:
+                return value[:max_length] + "..."
             return value
 
         elif isinstance(value, (int, float, bool)):
             return value
 
-        elif value is None:
-            return None
-
         elif isinstance(value, (dict, list)):
             # For complex types not handled elsewhere, convert to string
             str_value = str(value)
-            if len(str_value) > self.config.max_string_length:
-                return str_value[:self.config.max_string_length] + "..."
+            if len(str_value) > max_length:
+                return str_value[:max_length] + "..."
             return str_value
 
         else:
@@ -424,12 +618,8 @@ class ResourceSummarizer:
 
         # Extract key metadata fields
         extracted_metadata = {}
-        metadata_fields = [
-            "name", "namespace", "creationTimestamp", "generation",
-            "resourceVersion", "uid", "labels", "annotations"
-        ]
 
-        for field in metadata_fields:
+        for field in _METADATA_FIELDS:
             value = metadata.get(field)
             if value is not None:
                 extracted_metadata[field] = self._sanitize_value(value)
@@ -438,11 +628,7 @@ class ResourceSummarizer:
         owner_refs = metadata.get("ownerReferences", [])
         if owner_refs:
             extracted_metadata["ownerReferences"] = [
-                {
-                    "apiVersion": ref.get("apiVersion"),
-                    "kind": ref.get("kind"),
-                    "name": ref.get("name"),
-                }
+                _project_owner_reference(ref)
                 for ref in owner_refs[:5]  # Limit to 5 owners
             ]
 
@@ -464,24 +650,31 @@ class ResourceSummarizer:
         summaries: dict[ResourceRef, ResourceSummary],
     ) -> dict[str, list[dict[str, Any]]]:
         """Get a summary of relationships across all resources."""
-        relationship_map: dict[str, list[dict[str, Any]]] = {}
+        # Group by (source kind, target kind) and format the keys once at the end
+        relationship_map: dict[tuple[str, str], list[dict[str, Any]]] = {}
 
         for summary in summaries.values():
-            source_kind = summary.ref.kind
+            source_ref = summary.ref
+            source_kind = source_ref.kind
+            source = str(source_ref)
 
             for rel_ref in summary.relationships:
-                rel_key = f"{source_kind} -> {rel_ref.kind}"
+                rel_key = (source_kind, rel_ref.kind)
 
-                if rel_key not in relationship_map:
-                    relationship_map[rel_key] = []
+                edges = relationship_map.get(rel_key)
+                if edges is None:
+                    edges = relationship_map[rel_key] = []
 
-                relationship_map[rel_key].append({
-                    "source": str(summary.ref),
+                edges.append({
+                    "source": source,
                     "target": str(rel_ref),
-                    "relationship_type": self._infer_relationship_type(summary.ref, rel_ref),
+                    "relationship_type": self._infer_relationship_type(source_ref, rel_ref),
                 })
 
-        return relationship_map
+        return {
+            f"{source_kind} -> {target_kind}": edges
+            for (source_kind, target_kind), edges in relationship_map.items()
+        }
 
     def _infer_relationship_type(
         self,
@@ -489,25 +682,12 @@ class ResourceSummarizer:
         to_ref: ResourceRef,
     ) -> str:
         """Infer the relationship type between two resources."""
-        # This could be enhanced with more sophisticated logic
-        from_kind = from_ref.kind.lower()
-        to_kind = to_ref.kind.lower()
-
-        # Common patterns
-        if "cluster" in from_kind and "net" in to_kind:
-            return "uses"
-        elif "app" in from_kind and "env" in to_kind:
-            return "deploysTo"
-        elif "env" in from_kind and "cluster" in to_kind:
-            return "runsOn"
-        elif "project" in from_kind:
-            return "owns"
-        else:
-            return "references"
+        return _infer_relationship(from_ref.kind, to_ref.kind)
 
     def clear_cache(self) -> None:
         """Clear all caches."""
         self._schema_cache.clear()
+        self._plan_cache.clear()
         self._summary_cache.clear()
         self.logger.debug("Cleared summarizer caches")
 
@@ -11,6 +11,23 @@ from typing import Any
 
 from .schema_registry import SchemaRegistry
 
+# Summary fields kept per requesting resource type, in output order
+_SUMMARY_FIELD_ALLOWLISTS: dict[str, tuple[str, ...]] = {
+    # XApp needs deployment-relevant information
+    "XApp": (
+        "environmentType", "resources", "environmentConfig", "qualityGates",
+        "repository", "cicdEnabled",
+    ),
+    # XKubeSystem needs infrastructure information
+    "XKubeSystem": (
+        "version", "region", "nodeCount", "status", "systemComponents", "capacity",
+    ),
+    # XKubEnv needs environment configuration information
+    "XKubEnv": (
+        "environmentType", "resources", "qualityGates", "capacity", "systemComponents",
+    ),
+}
+
 
 class ResponseGenerator:
     """Generates standardized platform context responses."""
@@ -156,81 +173,14 @@ class ResponseGenerator:
 
         summary = instance.get("summary", {})
 
-        # Filter summary based on resource type
-        if resource_type == "XApp":
-            # XApp needs deployment-relevant information
-            filtered_summary = {}
-
-            # Include environment and resource information
-            if "environmentType" in summary:
-                filtered_summary["environmentType"] = summary["environmentType"]
-
-            if "resources" in summary:
-                filtered_summary["resources"] = summary["resources"]
-
-            if "environmentConfig" in summary:
-                filtered_summary["environmentConfig"] = summary["environmentConfig"]
-
-            if "qualityGates" in summary:
-                filtered_summary["qualityGates"] = summary["qualityGates"]
-
-            # Include deployment-specific fields
-            if "repository" in summary:
-                filtered_summary["repository"] = summary["repository"]
-
-            if "cicdEnabled" in summary:
-                filtered_summary["cicdEnabled"] = summary["cicdEnabled"]
-
-            filtered_instance["summary"] = filtered_summary
-
-        elif resource_type == "XKubeSystem":
-            # XKubeSystem needs infrastructure information
-            filtered_summary = {}
-
-            if "version" in summary:
-                filtered_summary["version"] = summary["version"]
-
-            if "region" in summary:
-                filtered_summary["region"] = summary["region"]
-
-            if "nodeCount" in summary:
-                filtered_summary["nodeCount"] = summary["nodeCount"]
-
-            if "status" in summary:
-                filtered_summary["status"] = summary["status"]
-
-            if "systemComponents" in summary:
-                filtered_summary["systemComponents"] = summary["systemComponents"]
-
-            if "capacity" in summary:
-                filtered_summary["capacity"] = summary["capacity"]
-
-            filtered_instance["summary"] = filtered_summary
-
-        elif resource_type == "XKubEnv":
-            # XKubEnv needs environment configuration information
-            filtered_summary = {}
-
-            if "environmentType" in summary:
-                filtered_summary["environmentType"] = summary["environmentType"]
-
-            if "resources" in summary:
-                filtered_summary["resources"] = summary["resources"]
-
-            if "qualityGates" in summary:
-                filtered_summary["qualityGates"] = summary["qualityGates"]
-
-            if "capacity" in summary:
-                filtered_summary["capacity"] = summary["capacity"]
-
-            if "systemComponents" in summary:
-                filtered_summary["systemComponents"] = summary["systemComponents"]
-
-            filtered_instance["summary"] = filtered_summary
-
-        else:
-            # For other resource types, include all summary data
+        # Filter summary based on resource type; other types include all summary data
+        allowed_fields = _SUMMARY_FIELD_ALLOWLISTS.get(resource_type)
+        if allowed_fields is None:
             filtered_instance["summary"] = summary
+        else:
+            filtered_instance["summary"] = {
+                field: summary[field] for field in allowed_fields if field in summary
+            }
 
         return filtered_instance
 
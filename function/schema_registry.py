@@ -45,6 +45,10 @@ class SchemaRegistry:
         self.logger.debug("Loading platform schemas and relationships")
         # Load platform hierarchy
         self.hierarchy = PLATFORM_HIERARCHY.copy()
+        self._accessible_sets: dict[str, frozenset[str]] = {
+            resource_type: frozenset(schemas)
+            for resource_type, schemas in self.hierarchy.items()
+        }
         self.logger.debug(f"Loaded hierarchy for {len(self.hierarchy)} resource types")
 
         # Load basic schema definitions
@@ -358,23 +362,27 @@ class SchemaRegistry:
 
     def get_accessible_schemas(self, resource_type: str) -> list[str]:
         """Get schemas accessible to a resource type based on platform relationships."""
-        self.logger.debug(f"Getting accessible schemas for resource type: {resource_type}")
+        self.logger.debug("Getting accessible schemas for resource type: %s", resource_type)
         if resource_type not in self.hierarchy:
-            self.logger.debug(f"Resource type '{resource_type}' not found in hierarchy")
+            self.logger.debug("Resource type '%s' not found in hierarchy", resource_type)
             return []
 
         accessible = self.hierarchy[resource_type]
-        self.logger.debug(f"Found {len(accessible)} accessible schemas for {resource_type}: {accessible}")
+        self.logger.debug("Found %d accessible schemas for %s: %s", len(accessible), resource_type, accessible)
         return accessible
 
+    def get_accessible_schema_set(self, resource_type: str) -> frozenset[str]:
+        """Get accessible schemas as a frozenset for constant-time membership checks."""
+        return self._accessible_sets.get(resource_type, frozenset())
+
     def get_schema_info(self, resource_type: str) -> ResourceSchema | None:
         """Get schema information for a specific resource type."""
-        self.logger.debug(f"Getting schema info for resource type: {resource_type}")
+        self.logger.debug("Getting schema info for resource type: %s", resource_type)
         schema = self.schemas.get(resource_type)
         if schema:
-            self.logger.debug(f"Found schema info for {resource_type}: {schema.api_version}/{schema.kind}")
+            self.logger.debug("Found schema info for %s: %s/%s", resource_type, schema.api_version, schema.kind)
         else:
-            self.logger.debug(f"No schema info found for {resource_type}")
+            self.logger.debug("No schema info found for %s", resource_type)
         return schema
 
     def get_relationship_path(self, from_type: str, to_type: str) -> list[str]:
@@ -383,8 +391,7 @@ class SchemaRegistry:
             return [from_type]
 
         # Simple direct relationship check
-        accessible = self.get_accessible_schemas(from_type)
-        if to_type in accessible:
+        if to_type in self.get_accessible_schema_set(from_type):
             return [from_type, to_type]
 
         # For now, return empty path for indirect relationships
@@ -151,7 +151,7 @@ class TransitiveDiscoveryEngine:
         if self.config.circuit_breaker_enabled:
             self._init_circuit_breakers()
         
-        self.logger.debug(f"TransitiveDiscoveryEngine initialized with max_depth={self.config.max_depth}")
+        self.logger.debug("TransitiveDiscoveryEngine initialized with max_depth=%s", self.config.max_depth)
 
     def _init_circuit_breakers(self) -> None:
         """Initialize circuit breakers for API endpoints."""
@@ -185,12 +185,12 @@ class TransitiveDiscoveryEngine:
             max_depth = self.config.max_depth
             
         start_time = time.time()
-        self.logger.info(f"Starting transitive discovery for {resource_type}: {target_ref.get('name')} (max_depth={max_depth})")
+        self.logger.info("Starting transitive discovery for %s: %s (max_depth=%s)", resource_type, target_ref.get("name"), max_depth)
         
         # Get relationship chains for the resource type
         relationship_chains = TRANSITIVE_RELATIONSHIP_CHAINS.get(resource_type, [])
         if not relationship_chains:
-            self.logger.debug(f"No transitive relationship chains defined for {resource_type}")
+            self.logger.debug("No transitive relationship chains defined for %s", resource_type)
             return {}
         
         discovered_resources: dict[str, list[TransitiveDiscoveredResource]] = {}
@@ -199,28 +199,28 @@ class TransitiveDiscoveryEngine:
         if self.config.memory_limit_mb > 0:
             initial_memory = self._estimate_memory_usage()
             if initial_memory > self.config.memory_limit_mb * 1024 * 1024:  # Convert MB to bytes
-                self.logger.warning(f"Memory usage {initial_memory / 1024 / 1024:.1f}MB exceeds limit {self.config.memory_limit_mb}MB")
+                self.logger.warning("Memory usage %.1fMB exceeds limit %sMB", initial_memory / 1024 / 1024, self.config.memory_limit_mb)
                 return {}
         
         # Process each relationship chain
         for target_kind, ref_chain in relationship_chains:
-            self.logger.debug(f"Processing relationship chain: {target_kind} via {ref_chain}")
+            self.logger.debug("Processing relationship chain: %s via %s", target_kind, ref_chain)
             
             if len(ref_chain) > max_depth:
-                self.logger.debug(f"Skipping chain {target_kind} - depth {len(ref_chain)} > max_depth {max_depth}")
+                self.logger.debug("Skipping chain %s - depth %s > max_depth %s", target_kind, len(ref_chain), max_depth)
                 continue
             
             # Check for early termination conditions
             if self.config.early_termination_enabled and len(discovered_resources) > 0:
                 total_discovered = sum(len(resources) for resources in discovered_resources.values())
                 if total_discovered >= self.config.max_resources_per_type * len(discovered_resources):
-                    self.logger.info(f"Early termination: discovered {total_discovered} resources")
+                    self.logger.info("Early termination: discovered %s resources", total_discovered)
                     break
                 
             chain_resources = await self._traverse_relationship_chain(
                 target_ref, resource_type, target_kind, ref_chain, context
             )
-            self.logger.debug(f"Traversal result for {target_kind}: {len(chain_resources)} resources")
+            self.logger.debug("Traversal result for %s: %s resources", target_kind, len(chain_resources))
             
             if chain_resources:
                 schema_type = self._kind_to_schema_type(target_kind)
@@ -238,7 +238,7 @@ class TransitiveDiscoveryEngine:
         
         duration = time.time() - start_time
         total_found = sum(len(resources) for resources in discovered_resources.values())
-        self.logger.info(f"Transitive discovery completed in {duration*1000:.1f}ms: found {total_found} resources across {len(discovered_resources)} types")
+        self.logger.info("Transitive discovery completed in %.1fms: found %s resources across %s types", duration*1000, total_found, len(discovered_resources))
         
         return discovered_resources
 
@@ -267,16 +267,17 @@ class TransitiveDiscoveryEngine:
             return []
             
         hops = len(ref_chain)
-        self.logger.debug(f"Traversing {hops}-hop chain: {source_type} → {target_kind} via {ref_chain}")
+        self.logger.debug("Traversing %s-hop chain: %s → %s via %s", hops, source_type, target_kind, ref_chain)
         
         # Start with source resource
         current_resources = [source_ref]
         relationship_path = [self._dict_to_resource_ref(source_ref)]
-        self.logger.debug(f"Starting traversal with {len(current_resources)} resources: {[r.get('name') for r in current_resources]}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Starting traversal with %s resources: %s", len(current_resources), [r.get("name") for r in current_resources])
         
         # Traverse each hop in the chain
         for hop_index, ref_field in enumerate(ref_chain):
-            self.logger.debug(f"Hop {hop_index + 1}/{len(ref_chain)}: Looking for {ref_field} references in {len(current_resources)} resources")
+            self.logger.debug("Hop %s/%s: Looking for %s references in %s resources", hop_index + 1, len(ref_chain), ref_field, len(current_resources))
             try:
                 # Set timeout for this depth level
                 next_resources = await asyncio.wait_for(
@@ -285,7 +286,7 @@ class TransitiveDiscoveryEngine:
                 )
                 
                 if not next_resources:
-                    self.logger.debug(f"No resources found at hop {hop_index + 1} for chain {ref_chain}")
+                    self.logger.debug("No resources found at hop %s for chain %s", hop_index + 1, ref_chain)
                     return []
                     
                 current_resources = next_resources
@@ -296,10 +297,10 @@ class TransitiveDiscoveryEngine:
                         relationship_path.append(self._dict_to_resource_ref(resource))
                         
             except asyncio.TimeoutError:
-                self.logger.warning(f"Timeout at hop {hop_index + 1} for chain {ref_chain}")
+                self.logger.warning("Timeout at hop %s for chain %s", hop_index + 1, ref_chain)
                 return []
             except Exception as e:
-                self.logger.warning(f"Error at hop {hop_index + 1} for chain {ref_chain}: {e}")
+                self.logger.warning("Error at hop %s for chain %s: %s", hop_index + 1, ref_chain, e)
                 return []
         
         # Convert final resources to TransitiveDiscoveredResource objects
@@ -321,7 +322,7 @@ class TransitiveDiscoveryEngine:
             )
             discovered.append(transitive_resource)
         
-        self.logger.debug(f"Found {len(discovered)} resources via {hops}-hop chain to {target_kind}")
+        self.logger.debug("Found %s resources via %s-hop chain to %s", len(discovered), hops, target_kind)
         return discovered
 
     async def _find_next_hop_resources(
@@ -357,19 +358,19 @@ class TransitiveDiscoveryEngine:
                 
                 for result in results:
                     if isinstance(result, Exception):
-                        self.logger.warning(f"Parallel resource processing failed: {result}")
+                        self.logger.warning("Parallel resource processing failed: %s", result)
                         continue
                     next_resources.extend(result)
                     
             except Exception as e:
-                self.logger.warning(f"Parallel processing failed at hop {hop_number}, falling back to sequential: {e}")
+                self.logger.warning("Parallel processing failed at hop %s, falling back to sequential: %s", hop_number, e)
                 # Fallback to sequential processing
                 for resource in current_resources:
                     try:
                         refs = await self._find_resources_referencing(resource, ref_field)
                         next_resources.extend(refs)
                     except Exception as e:
-                        self.logger.warning(f"Sequential resource processing failed: {e}")
+                        self.logger.warning("Sequential resource processing failed: %s", e)
         else:
             # Sequential processing
             for resource in current_resources:
@@ -377,7 +378,7 @@ class TransitiveDiscoveryEngine:
                     refs = await self._find_resources_referencing(resource, ref_field)
                     next_resources.extend(refs)
                 except Exception as e:
-                    self.logger.warning(f"Resource processing failed at hop {hop_number}: {e}")
+                    self.logger.warning("Resource processing failed at hop %s: %s", hop_number, e)
         
         return next_resources
 
@@ -415,19 +416,20 @@ class TransitiveDiscoveryEngine:
         search_configs = self._get_search_configs_for_ref_field(ref_field)
         found_resources = []
         
-        self.logger.debug(f"Searching for resources with {ref_field} referencing {target_name}/{target_namespace}")
-        self.logger.debug(f"Will search {len(search_configs)} resource types: {[kind for kind, _ in search_configs]}")
+        self.logger.debug("Searching for resources with %s referencing %s/%s", ref_field, target_name, target_namespace)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Will search %s resource types: %s", len(search_configs), [kind for kind, _ in search_configs])
         
         for kind, api_version in search_configs:
             try:
-                self.logger.debug(f"Searching {kind} resources with {ref_field} = {target_name}")
+                self.logger.debug("Searching %s resources with %s = %s", kind, ref_field, target_name)
                 resources = await self._search_resources_with_ref(
                     kind, api_version, ref_field, target_name, target_namespace
                 )
-                self.logger.debug(f"Found {len(resources)} {kind} resources")
+                self.logger.debug("Found %s %s resources", len(resources), kind)
                 found_resources.extend(resources)
             except Exception as e:
-                self.logger.warning(f"Failed to search {kind} for {ref_field} references: {e}")
+                self.logger.warning("Failed to search %s for %s references: %s", kind, ref_field, e)
         
         # Cache result if enabled
         if self.config.cache_intermediate_results:
@@ -460,7 +462,7 @@ class TransitiveDiscoveryEngine:
         if self.config.circuit_breaker_enabled:
             circuit_breaker = self._circuit_breakers.get(kind)
             if circuit_breaker and not circuit_breaker.can_execute():
-                self.logger.warning(f"Circuit breaker open for {kind}, skipping API call")
+                self.logger.warning("Circuit breaker open for %s, skipping API call", kind)
                 return []
         
         try:
@@ -488,14 +490,14 @@ class TransitiveDiscoveryEngine:
                     
                     # Check resource limit per API call
                     if len(matching_resources) >= self.config.max_resources_per_type:
-                        self.logger.debug(f"Reached max resources limit for {kind}")
+                        self.logger.debug("Reached max resources limit for %s", kind)
                         break
             
             # Record success in circuit breaker
             if self.config.circuit_breaker_enabled and kind in self._circuit_breakers:
                 self._circuit_breakers[kind].record_success()
             
-            self.logger.debug(f"Found {len(matching_resources)} {kind} resources referencing {target_name} via {ref_field}")
+            self.logger.debug("Found %s %s resources referencing %s via %s", len(matching_resources), kind, target_name, ref_field)
             return matching_resources
             
         except Exception as e:
@@ -505,7 +507,7 @@ class TransitiveDiscoveryEngine:
             if self.config.circuit_breaker_enabled and kind in self._circuit_breakers:
                 self._circuit_breakers[kind].record_failure()
                 
-            self.logger.warning(f"Search failed for {kind} resources: {e}")
+            self.logger.warning("Search failed for %s resources: %s", kind, e)
             return []
 
     def _resource_references_target(
@@ -664,7 +666,7 @@ class TransitiveDiscoveryEngine:
         for key, value in kwargs.items():
             if hasattr(self.config, key):
                 setattr(self.config, key, value)
-                self.logger.debug(f"Updated config {key} = {value}")
+                self.logger.debug("Updated config %s = %s", key, value)
 
     def clear_cache(self) -> None:
         """Clear intermediate result cache."""
@@ -689,7 +691,7 @@ class TransitiveDiscoveryEngine:
             
             return total_size
         except Exception as e:
-            self.logger.warning(f"Failed to estimate memory usage: {e}")
+            self.logger.warning("Failed to estimate memory usage: %s", e)
             return 0
 
     def get_performance_stats(self) -> dict[str, Any]:
@@ -755,19 +757,19 @@ class TransitiveDiscoveryEngine:
         # Check timeout
         elapsed = time.time() - start_time
         if elapsed > self.config.timeout_per_depth:
-            self.logger.warning(f"Timeout reached: {elapsed:.1f}s > {self.config.timeout_per_depth}s")
+            self.logger.warning("Timeout reached: %.1fs > %ss", elapsed, self.config.timeout_per_depth)
             return True
         
         # Check resource limits
         if discovered_count >= self.config.max_resources_per_type:
-            self.logger.info(f"Resource limit reached: {discovered_count} >= {self.config.max_resources_per_type}")
+            self.logger.info("Resource limit reached: %s >= %s", discovered_count, self.config.max_resources_per_type)
             return True
         
         # Check memory usage
         if self.config.memory_limit_mb > 0:
             current_memory = self._estimate_memory_usage()
             if current_memory > self.config.memory_limit_mb * 1024 * 1024:
-                self.logger.warning(f"Memory limit reached: {current_memory / 1024 / 1024:.1f}MB > {self.config.memory_limit_mb}MB")
+                self.logger.warning("Memory limit reached: %.1fMB > %sMB", current_memory / 1024 / 1024, self.config.memory_limit_mb)
                 return True
         
         return False
\ No newline at end of file
@@ -7,17 +7,19 @@ mock Kubernetes resources, and end-to-end resolution workflows.
 import asyncio
 import time
 from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from function.k8s_client import K8sPermissionError, K8sResourceNotFoundError
 from function.resource_resolver import (
     ResolvedResource,
+    ResourceCache,
     ResourceRef,
     ResourceResolutionError,
     ResourceResolver,
 )
-from function.resource_summarizer import ResourceSummarizer, SummarizationConfig
+from function.resource_summarizer import ResourceSummarizer, SummarizationConfig, _compile_plan
 from function.schema_registry import SchemaRegistry
 
 # Mock Kubernetes Resources
@@ -485,6 +487,84 @@ class TestResourceResolutionEngine:
         related_kinds = {r.ref.kind for r in resolved_resources.values()}
         assert "XKubeCluster" in related_kinds
 
+    @pytest.mark.asyncio
+    async def test_relationship_layers_resolve_in_parallel(self, mock_k8s_client):
+        """Test that each relationship layer is fetched concurrently."""
+        await mock_k8s_client.connect()
+        resolver = ResourceResolver(mock_k8s_client)
+        in_flight = 0
+        peak = 0
+
+        async def get_resource(api_version, kind, name, namespace=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            spec = {}
+            if kind == "XKubeCluster":
+                spec = {
+                    "kubeNetRef": {"name": "net"},
+                    "githubProjectRef": {"name": "proj"},
+                    "kubenvRefs": [{"name": "dev"}, {"name": "prod"}],
+                }
+            return {"kind": kind, "metadata": {"name": name}, "spec": spec}
+
+        mock_k8s_client.get_resource = get_resource
+        ref = ResourceRef("platform.kubecore.io/v1alpha1", "XKubeCluster", "cluster", "default")
+
+        resolved_resources = await resolver.resolve_with_relationships(ref, max_resources=10)
+
+        assert len(resolved_resources) == 5
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_relationship_depth_limit(self, mock_k8s_client):
+        """Test that relationships stop being followed max_depth hops from the root."""
+        await mock_k8s_client.connect()
+
+        async def get_resource(api_version, kind, name, namespace=None):
+            spec = {}
+            if kind == "XKubeCluster":
+                spec = {"githubProjectRef": {"name": "proj"}}
+            elif kind == "XGitHubProject":
+                spec = {"githubProviderRef": {"name": "provider"}}
+            return {"kind": kind, "metadata": {"name": name}, "spec": spec}
+
+        mock_k8s_client.get_resource = get_resource
+        ref = ResourceRef("platform.kubecore.io/v1alpha1", "XKubeCluster", "cluster", "default")
+
+        kinds_by_depth = {}
+        for max_depth in (0, 1, 2):
+            resolved_resources = await ResourceResolver(mock_k8s_client).resolve_with_relationships(
+                ref, max_depth=max_depth
+            )
+            kinds_by_depth[max_depth] = {r.kind for r in resolved_resources}
+
+        assert kinds_by_depth == {
+            0: {"XKubeCluster"},
+            1: {"XKubeCluster", "XGitHubProject"},
+            2: {"XKubeCluster", "XGitHubProject", "XGitHubProvider"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_zero_depth_resolves_root_only(self, mock_k8s_client):
+        """Test that max_depth=0 returns the root without following relationships."""
+        await mock_k8s_client.connect()
+        ref = ResourceRef("platform.kubecore.io/v1alpha1", "XKubeCluster", "cluster", "default")
+        mock_k8s_client.get_resource = AsyncMock(return_value={
+            "kind": "XKubeCluster",
+            "metadata": {"name": "cluster"},
+            "spec": {"githubProjectRef": {"name": "proj"}},
+        })
+
+        resolved_resources = await ResourceResolver(mock_k8s_client).resolve_with_relationships(
+            ref, max_depth=0
+        )
+
+        assert list(resolved_resources) == [ref]
+        mock_k8s_client.get_resource.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_circular_dependency_detection(self, resource_resolver, mock_k8s_client):
         """Test circular dependency detection and resolution limits."""
@@ -524,6 +604,91 @@ class TestResourceResolutionEngine:
         cycles = resource_resolver.detect_circular_dependencies(test_resources)
         assert len(cycles) > 0  # Should detect at least one cycle
 
+    @pytest.mark.asyncio
+    async def test_missing_resource_negative_cache(self, resource_resolver, mock_k8s_client):
+        """Test that missing resources are not refetched within the negative TTL."""
+        await mock_k8s_client.connect()
+        ref = ResourceRef("platform.kubecore.io/v1alpha1", "XApp", "missing-app", "default")
+
+        with pytest.raises(ResourceResolutionError, match="Resource not found"):
+            await resource_resolver.resolve_resource(ref)
+        call_count = mock_k8s_client.call_count
+
+        with pytest.raises(ResourceResolutionError, match="Resource not found"):
+            await resource_resolver.resolve_resource(ref)
+
+        assert mock_k8s_client.call_count == call_count
+
+        resource_resolver.cache.invalidate(ref)
+        with pytest.raises(ResourceResolutionError):
+            await resource_resolver.resolve_resource(ref)
+        assert mock_k8s_client.call_count == call_count + 1
+
+    def test_reference_kind_inference(self, resource_resolver):
+        """Test kind inference for references without apiVersion and kind."""
+        resource = ResolvedResource(
+            ref=ResourceRef("platform.kubecore.io/v1alpha1", "XKubeCluster", "demo", "default"),
+            data={
+                "spec": {
+                    "kubeNetRef": {"name": "primary"},
+                    "githubProjectRef": {"name": "demo-cluster"},
+                    "config": {"sourceRef": {"name": "shared-project"}},
+                    "kubenvRefs": [{"name": "staging"}],
+                }
+            },
+        )
+
+        relationships = resource_resolver._extract_relationships(resource)
+
+        assert [(ref.kind, ref.name) for ref in relationships] == [
+            ("XKubeNet", "primary"),
+            ("XGitHubProject", "demo-cluster"),
+            ("XGitHubProject", "shared-project"),
+            ("XKubEnv", "staging"),
+        ]
+
+    def test_resource_cache_lru_eviction(self):
+        """Test that the resource cache evicts the least recently used entry."""
+        cache = ResourceCache(ttl=60.0, max_size=2)
+        refs = [ResourceRef("test/v1", "Resource", f"resource-{i}", "default") for i in range(3)]
+
+        cache.put(ResolvedResource(ref=refs[0], data={}))
+        cache.put(ResolvedResource(ref=refs[1], data={}))
+        assert cache.get(refs[0]) is not None  # refs[1] is now least recently used
+
+        cache.put(ResolvedResource(ref=refs[2], data={}))
+
+        assert cache.size() == 2
+        assert cache.get(refs[1]) is None
+        assert cache.get(refs[0]) is not None
+        assert cache.get(refs[2]) is not None
+        assert (cache.hits, cache.misses, cache.evictions) == (3, 1, 1)
+
+    def test_relationship_type_lookup(self, resource_resolver):
+        """Test relationship typing between platform kinds."""
+        cluster = ResourceRef("platform.kubecore.io/v1alpha1", "XKubeCluster", "cluster", "default")
+        network = ResourceRef("network.platform.kubecore.io/v1alpha1", "XKubeNet", "network", "default")
+        app = ResourceRef("app.kubecore.io/v1alpha1", "XApp", "app", "default")
+
+        assert resource_resolver._get_relationship_type(cluster, network) == "uses"
+        assert resource_resolver._get_relationship_type(network, cluster) == "supports"
+        assert resource_resolver._get_relationship_type(cluster, app) is None
+
+    def test_circular_dependency_detection_deep_chain(self, resource_resolver):
+        """Test cycle detection on chains deeper than the recursion limit."""
+        refs = [ResourceRef("test/v1", "Resource", f"resource-{i}", "default") for i in range(3000)]
+        test_resources = {
+            ref: ResolvedResource(ref=ref, data={}, relationships=refs[i + 1:i + 2])
+            for i, ref in enumerate(refs)
+        }
+
+        assert resource_resolver.detect_circular_dependencies(test_resources) == []
+
+        test_resources[refs[-1]].relationships = [refs[1000]]
+        cycles = resource_resolver.detect_circular_dependencies(test_resources)
+
+        assert cycles == [refs[1000:] + [refs[1000]]]
+
     @pytest.mark.asyncio
     async def test_parallel_resolution(self, resource_resolver, mock_k8s_client):
         """Test parallel resource resolution."""
@@ -546,6 +711,80 @@ class TestResourceResolutionEngine:
         # Should be faster than sequential resolution
         assert end_time - start_time < 1.0  # Should complete quickly with mock
 
+    @pytest.mark.asyncio
+    async def test_parallel_resolution_bounds_tasks(self, mock_k8s_client):
+        """Test that parallel resolution never runs more than max_concurrent fetches."""
+        await mock_k8s_client.connect()
+        resolver = ResourceResolver(mock_k8s_client, max_concurrent=10)
+        in_flight = 0
+        peak = 0
+
+        async def get_resource(api_version, kind, name, namespace=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            if name == "missing":
+                raise K8sResourceNotFoundError(name)
+            return {"kind": kind, "metadata": {"name": name}}
+
+        mock_k8s_client.get_resource = get_resource
+        refs = [ResourceRef("test/v1", "Resource", f"resource-{i}", "default") for i in range(20)]
+        refs.append(ResourceRef("test/v1", "Resource", "missing", "default"))
+
+        results = await resolver.resolve_parallel(refs, max_concurrent=3)
+
+        assert peak == 3
+        assert len(results) == 21
+        assert isinstance(results[refs[-1]], ResourceResolutionError)
+        assert all(isinstance(results[ref], ResolvedResource) for ref in refs[:-1])
+
+    @pytest.mark.asyncio
+    async def test_parallel_resolution_shares_resolver_limit(self, mock_k8s_client):
+        """Test that concurrent parallel resolutions share the resolver-wide limit."""
+        await mock_k8s_client.connect()
+        resolver = ResourceResolver(mock_k8s_client, max_concurrent=3)
+        in_flight = 0
+        peak = 0
+
+        async def get_resource(api_version, kind, name, namespace=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return {"kind": kind, "metadata": {"name": name}}
+
+        mock_k8s_client.get_resource = get_resource
+        batches = [
+            [ResourceRef("test/v1", "Resource", f"{batch}-{i}", "default") for i in range(10)]
+            for batch in ("a", "b")
+        ]
+
+        results = await asyncio.gather(*(resolver.resolve_parallel(refs) for refs in batches))
+
+        assert peak == 3
+        assert all(len(result) == 10 for result in results)
+
+    @pytest.mark.asyncio
+    async def test_parallel_resolution_streams_results(self, mock_k8s_client):
+        """Test that results are yielded as soon as each resolution finishes."""
+        await mock_k8s_client.connect()
+        resolver = ResourceResolver(mock_k8s_client)
+
+        async def get_resource(api_version, kind, name, namespace=None):
+            await asyncio.sleep(0.05 if name == "slow" else 0)
+            return {"kind": kind, "metadata": {"name": name}}
+
+        mock_k8s_client.get_resource = get_resource
+        refs = [ResourceRef("test/v1", "Resource", name, "default") for name in ("slow", "fast-a", "fast-b")]
+
+        order = [ref.name async for ref, _ in resolver.resolve_parallel_iter(refs)]
+
+        assert order[-1] == "slow"
+        assert sorted(order[:2]) == ["fast-a", "fast-b"]
+
     @pytest.mark.asyncio
     async def test_resolution_limits(self, resource_resolver, mock_k8s_client):
         """Test resource resolution limits."""
@@ -588,6 +827,25 @@ class TestResourceSummarization:
         assert "spec" in summary.summary
         assert summary.summary["spec"]["organization"] == "kubecore-org"
         assert summary.metadata["name"] == "github-provider"
+        assert not hasattr(summary, "__dict__")
+
+    def test_owner_reference_metadata(self, resource_summarizer):
+        """Test that owner references keep apiVersion, kind and name only."""
+        ref = ResourceRef("github.platform.kubecore.io/v1alpha1", "XGitHubProject", "my-project", "kubecore-system")
+
+        metadata = resource_summarizer._extract_metadata(MOCK_RESOURCES[ref])
+        assert metadata["ownerReferences"] == [{
+            "apiVersion": "github.platform.kubecore.io/v1alpha1",
+            "kind": "XGitHubProvider",
+            "name": "github-provider",
+        }]
+
+        metadata = resource_summarizer._extract_metadata(
+            {"metadata": {"ownerReferences": [{"kind": "XKubeCluster", "name": "cluster"}]}}
+        )
+        assert metadata["ownerReferences"] == [
+            {"apiVersion": None, "kind": "XKubeCluster", "name": "cluster"}
+        ]
 
     def test_summarization_with_relationships(self, resource_summarizer):
         """Test summarization including relationships."""
@@ -610,10 +868,34 @@ class TestResourceSummarization:
 
         summary = resource_summarizer.summarize_resource(resolved)
 
-        assert len(summary.relationships) == 2
+        assert summary.relationships == tuple(relationships)
         assert summary.summary["spec"]["region"] == "us-west-2"
         assert summary.summary["spec"]["version"] == "1.28"
 
+    def test_relationship_summary(self, resource_summarizer):
+        """Test that relationships are grouped by source and target kind."""
+        ref = ResourceRef(
+            "platform.kubecore.io/v1alpha1",
+            "XKubeCluster",
+            "production-cluster",
+            "kubecore-system"
+        )
+        project = ResourceRef("github.platform.kubecore.io/v1alpha1", "XGitHubProject", "my-project", "kubecore-system")
+        network = ResourceRef("network.platform.kubecore.io/v1alpha1", "XKubeNet", "primary-network", "kubecore-system")
+
+        resolved = ResolvedResource(ref=ref, data=MOCK_RESOURCES[ref], relationships=[project, network])
+        summary = resource_summarizer.summarize_resource(resolved)
+
+        relationship_map = resource_summarizer.get_relationship_summary({ref: summary})
+
+        assert list(relationship_map) == ["XKubeCluster -> XGitHubProject", "XKubeCluster -> XKubeNet"]
+        assert relationship_map["XKubeCluster -> XKubeNet"] == [{
+            "source": str(ref),
+            "target": str(network),
+            "relationship_type": "uses",
+        }]
+        assert relationship_map["XKubeCluster -> XGitHubProject"][0]["relationship_type"] == "references"
+
     def test_multiple_resource_summarization(self, resource_summarizer):
         """Test summarizing multiple resources."""
         resolved_resources = {}
@@ -627,6 +909,22 @@ class TestResourceSummarization:
         for ref, summary in summaries.items():
             assert summary.ref == ref
             assert "spec" in summary.summary or "error" in summary.summary
+        assert len({summary.extraction_time for summary in summaries.values()}) == 1
+
+    def test_multiple_summarization_looks_up_schema_once_per_kind(self, resource_summarizer):
+        """Test that a batch resolves each kind's schema once."""
+        refs = [ref for ref in MOCK_RESOURCES if ref.kind == "XKubEnv"]
+        assert len(refs) > 1
+
+        with patch.object(
+            resource_summarizer, "_get_resource_schema", wraps=resource_summarizer._get_resource_schema
+        ) as get_schema:
+            summaries = resource_summarizer.summarize_multiple(
+                {ref: ResolvedResource(ref=ref, data=MOCK_RESOURCES[ref]) for ref in refs}
+            )
+
+        get_schema.assert_called_once_with("XKubEnv")
+        assert list(summaries) == refs
 
     def test_summarization_field_filtering(self, resource_summarizer):
         """Test summarization with specific field requests."""
@@ -648,6 +946,73 @@ class TestResourceSummarization:
         assert "environmentType" in spec
         assert "resources" in spec
         # Should not include other fields if filtering is working
+        assert set(spec) <= requested_fields
+
+    def test_config_positional_fields(self):
+        """Test that the original config fields keep their positions."""
+        config = SummarizationConfig(3, 10, 500, True, False, True, False, True, True, True)
+
+        assert config.parallel_processing is False
+        assert config.include_status is True
+        assert config.summary_cache_max == 1000
+
+    def test_summary_cache_is_bounded(self, schema_registry):
+        """Test that the summary cache reuses summaries and evicts the oldest."""
+        summarizer = ResourceSummarizer(schema_registry, SummarizationConfig(summary_cache_max=2))
+        resolved = [
+            ResolvedResource(ref=ref, data=MOCK_RESOURCES[ref])
+            for ref in list(MOCK_RESOURCES)[:3]
+        ]
+
+        first = summarizer.summarize_resource(resolved[0])
+        assert summarizer.summarize_resource(resolved[0]) is first
+
+        summarizer.summarize_resource(resolved[1])
+        summarizer.summarize_resource(resolved[2])
+
+        assert summarizer.get_cache_stats()["summary_cache_size"] == 2
+        assert summarizer.summarize_resource(resolved[0]) is not first
+
+    def test_extraction_plan_cached_per_kind(self, resource_summarizer):
+        """Test that schema extraction plans are compiled once per kind."""
+        refs = [ref for ref in MOCK_RESOURCES if ref.kind == "XKubEnv"]
+        for ref in refs:
+            resource_summarizer.summarize_resource(ResolvedResource(ref=ref, data=MOCK_RESOURCES[ref]))
+
+        plan = resource_summarizer._plan_cache[("XKubEnv", "spec")]
+        assert plan
+        assert resource_summarizer._get_extraction_plan(
+            resource_summarizer._get_resource_schema("XKubEnv"), "spec"
+        ) is plan
+
+        resource_summarizer.clear_cache()
+        assert not resource_summarizer._plan_cache
+
+    def test_schema_defaults_fill_missing_fields_only(self, schema_registry):
+        """Test that schema defaults apply to missing fields but not explicit nulls."""
+        summarizer = ResourceSummarizer(schema_registry, SummarizationConfig(include_defaults=True))
+        plan = _compile_plan({
+            "replicas": {"type": "integer", "default": 1},
+            "tier": {"type": "string", "default": "standard"},
+            "image": {"type": "string"},
+        })
+
+        extracted = summarizer._extract_fields_by_schema({"tier": None, "image": "app:1"}, plan)
+
+        assert extracted == {"replicas": 1, "image": "app:1"}
+
+    def test_deep_nesting_without_recursion(self, schema_registry):
+        """Test that key field extraction handles nesting beyond the recursion limit."""
+        summarizer = ResourceSummarizer(schema_registry, SummarizationConfig(max_depth=5000))
+        data = leaf = {}
+        for _ in range(4000):
+            leaf["name"] = leaf = {}
+        leaf["name"] = "bottom"
+
+        extracted = summarizer._extract_key_fields(data)
+        for _ in range(4000):
+            extracted = extracted["name"]
+        assert extracted == {"name": "bottom"}
 
     def test_array_summarization(self, resource_summarizer):
         """Test summarization of array fields."""
@@ -861,6 +1226,9 @@ class TestEndToEndWorkflows:
         # Verify cache stats
         cache_stats = resolver.get_cache_stats()
         assert cache_stats["size"] >= 1
+        assert cache_stats["hits"] == 2
+        assert cache_stats["misses"] == 1
+        assert cache_stats["hit_rate"] == pytest.approx(2 / 3)
 
 
 if __name__ == "__main__":
@@ -5,7 +5,8 @@ from unittest.mock import AsyncMock
 import pytest
 
 from function.insights_engine import InsightsEngine
-from function.k8s_client import K8sClient
+from function.k8s_client import K8sClient, K8sConnectionError
+from function import query_processor as query_processor_module
 from function.query_processor import QueryProcessor
 from function.resource_resolver import ResourceResolver
 from function.resource_summarizer import ResourceSummarizer
@@ -216,6 +217,33 @@ class TestQueryProcessor:
         assert "availableSchemas" in result
         assert "relationships" in result
 
+    @pytest.mark.asyncio
+    async def test_generic_query_maps_requested_names(self, query_processor):
+        """Test that generic requestor types map requested names to accessible kinds."""
+        input_spec = {
+            "query": {
+                "resourceType": "XGitHubProject",
+                "requestedSchemas": ["kubeCluster"]
+            },
+            "context": {
+                "requestorName": "demo-project",
+                "requestorNamespace": "default",
+                "references": {
+                    "kubeClusterRefs": [
+                        {"name": "demo-cluster", "namespace": "default"}
+                    ]
+                }
+            }
+        }
+
+        result = await query_processor.process_query(input_spec)
+
+        cluster_schema = result["availableSchemas"]["kubeCluster"]
+        assert cluster_schema["metadata"]["kind"] == "XKubeCluster"
+        assert cluster_schema["metadata"]["relationshipPath"] == ["generic", "kubeCluster"]
+        assert [inst["name"] for inst in cluster_schema["instances"]] == ["demo-cluster"]
+        assert result["relationships"]["direct"] == []
+
     @pytest.mark.asyncio
     async def test_empty_references(self, query_processor):
         """Test query processing with no references."""
@@ -238,6 +266,165 @@ class TestQueryProcessor:
         assert "kubEnv" in result["availableSchemas"]
         assert len(result["availableSchemas"]["kubEnv"]["instances"]) == 0
 
+    @pytest.mark.asyncio
+    async def test_direct_relationships_copy_constants(self, query_processor):
+        """Test that each response gets its own copies of the shared relationship tables."""
+        input_spec = {
+            "query": {"resourceType": "XApp", "requestedSchemas": []},
+            "context": {"requestorName": "art-api", "requestorNamespace": "default"}
+        }
+
+        first = await query_processor.process_query(input_spec)
+        second = await query_processor.process_query(input_spec)
+
+        first_direct = first["relationships"]["direct"]
+        second_direct = second["relationships"]["direct"]
+
+        # Each response gets its own plain dicts, so it can be serialised into
+        # a protobuf Struct and mutated without touching the module constants
+        assert first_direct is not second_direct
+        assert all(type(rel) is dict for rel in first_direct)
+        for rel, other, constant in zip(
+            first_direct, second_direct, query_processor_module._XAPP_RELATIONSHIPS, strict=True
+        ):
+            assert rel == constant
+            assert rel is not constant
+            assert rel is not other
+
+    def test_schema_failure_keeps_other_schemas(self, query_processor, monkeypatch):
+        """Test that one failing schema does not drop the other schemas."""
+        def failing_builder(self, ref):
+            raise RuntimeError("boom")
+
+        config = query_processor_module._QUERY_CONFIG["XApp"]
+        monkeypatch.setitem(config.summarizers, "githubProject", failing_builder)
+
+        registry = query_processor.schema_registry
+        schema_infos = {
+            "kubEnv": registry.get_schema_info("XKubEnv"),
+            "githubProject": registry.get_schema_info("XGitHubProject"),
+        }
+        refs_by_type = {
+            "kubEnv": [{"name": "demo-dev", "namespace": "test"}],
+            "githubProject": [{"name": "demo-project", "namespace": "test"}],
+        }
+        available_schemas = {}
+
+        query_processor._process_schemas(
+            ["kubEnv", "githubProject"], schema_infos, refs_by_type, available_schemas, config
+        )
+
+        assert "githubProject" not in available_schemas
+        assert len(available_schemas["kubEnv"]["instances"]) == 1
+
+    def test_schema_name_mappings(self):
+        """Test requested-name and kind lookups share one mapping table."""
+        assert QueryProcessor._map_requested_to_actual_schema("kubEnv") == "XKubEnv"
+        assert QueryProcessor._map_requested_to_actual_schema("XKubEnv") == "XKubEnv"
+        assert QueryProcessor._kind_to_ref_type("XKubeCluster") == "kubeClusterRefs"
+        assert QueryProcessor._kind_to_ref_type("XGitHubApp") == "githubAppRefs"
+        assert QueryProcessor._kind_to_ref_type("Unknown") is None
+
+    @pytest.mark.asyncio
+    async def test_reverse_search_shares_listing(self, query_processor, mock_k8s_client):
+        """Test that searches of the same kind reuse one list call per request."""
+        mock_k8s_client.list_resources.return_value = {
+            "items": [
+                {
+                    "metadata": {"name": "demo-env", "namespace": "test"},
+                    "spec": {
+                        "kubeClusterRef": {"name": "demo-cluster", "namespace": "test"},
+                        "qualityGates": [{"ref": {"name": "demo-cluster", "namespace": "test"}}]
+                    }
+                }
+            ]
+        }
+        list_cache = {}
+        api_version = "platform.kubecore.io/v1alpha1"
+
+        by_ref = await query_processor._search_for_reverse_refs(
+            "demo-cluster", "test", "XKubEnv", api_version, "kubeClusterRef", list_cache
+        )
+        by_list = await query_processor._search_for_reverse_refs(
+            "demo-cluster", "test", "XKubEnv", api_version, "qualityGates", list_cache
+        )
+        again = await query_processor._search_for_reverse_refs(
+            "demo-cluster", "test", "XKubEnv", api_version, "kubeClusterRef", list_cache
+        )
+
+        assert [ref["name"] for ref in by_ref] == ["demo-env"]
+        assert [ref["name"] for ref in by_list] == ["demo-env"]
+        assert [ref["name"] for ref in again] == ["demo-env"]
+        # The CRDs declare no selectable fields, so the shared listing is unfiltered
+        mock_k8s_client.list_resources.assert_awaited_once_with(
+            api_version=api_version, kind="XKubEnv", limit=100
+        )
+
+    @pytest.mark.asyncio
+    async def test_reverse_search_list_failure(self, query_processor, mock_k8s_client):
+        """Test that a failed listing only empties its own search."""
+        mock_k8s_client.list_resources.side_effect = K8sConnectionError(
+            "Failed to list resources XKubeSystem: (500) Internal Server Error"
+        )
+
+        refs = await query_processor._search_for_reverse_refs(
+            "demo-cluster", "test", "XKubeSystem", "platform.kubecore.io/v1alpha1", "kubeClusterRef"
+        )
+
+        assert refs == []
+        mock_k8s_client.list_resources.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reverse_search_without_target_name(self, query_processor, mock_k8s_client):
+        """Test that an empty target name skips the list call entirely."""
+        refs = await query_processor._search_for_reverse_refs(
+            "", "test", "XKubEnv", "platform.kubecore.io/v1alpha1", "kubeClusterRef"
+        )
+
+        assert refs == []
+        mock_k8s_client.list_resources.assert_not_awaited()
+
+    def test_contains_reference_to(self):
+        """Test direct and list reference matching used by reverse discovery."""
+        contains = QueryProcessor._contains_reference_to
+        resource = {
+            "spec": {
+                "kubeClusterRef": {"name": "demo-cluster", "namespace": "test"},
+                "qualityGates": [
+                    "not-a-ref",
+                    {"ref": {"name": "security-scan", "namespace": "test"}},
+                    {"name": "perf-test"}
+                ]
+            }
+        }
+
+        assert contains(resource, "demo-cluster", "test", "kubeClusterRef")
+        assert contains(resource, "demo-cluster", None, "kubeClusterRef")
+        assert not contains(resource, "demo-cluster", "other", "kubeClusterRef")
+        assert contains(resource, "security-scan", "test", "qualityGates")
+        assert contains(resource, "perf-test", None, "qualityGates")
+        assert not contains(resource, "perf-test", "test", "qualityGates")
+        assert not contains(resource, "demo-cluster", "test", "githubProjectRef")
+        assert not contains({}, "demo-cluster", "test", "kubeClusterRef")
+        assert query_processor_module._DIRECT_REF_FIELDS == {
+            "githubProjectRef", "kubeClusterRef", "kubeNetRef"
+        }
+
+    @pytest.mark.asyncio
+    async def test_transitive_discovery_skipped_without_requestor_name(self, query_processor):
+        """Test that transitive discovery is not attempted for an unnamed requestor."""
+        engine = AsyncMock()
+        query_processor.set_transitive_discovery_engine(engine)
+        input_spec = {
+            "query": {"resourceType": "XApp", "requestedSchemas": ["kubEnv"]},
+            "context": {"references": {}}
+        }
+
+        result = await query_processor.process_query(input_spec)
+
+        assert result["requestor"]["name"] == "unknown"
+        engine.discover_transitive_relationships.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_missing_resource_type(self, query_processor):
         """Test query processing with missing resource type."""
@@ -414,6 +601,29 @@ class TestResponseGenerator:
         assert "capacity" in summary
         assert "appSpecificData" not in summary
 
+    def test_schema_filtering_for_kubenv(self, response_generator):
+        """Test schema filtering specific to XKubEnv resource type."""
+        schema_data = {
+            "metadata": {"apiVersion": "test", "kind": "test", "accessible": True, "relationshipPath": []},
+            "instances": [
+                {
+                    "name": "test-cluster",
+                    "namespace": "default",
+                    "summary": {
+                        "capacity": {"cpu": "16"},
+                        "environmentType": "dev",
+                        "repository": "not-for-envs",
+                        "qualityGates": ["test"],
+                    }
+                }
+            ]
+        }
+
+        filtered = response_generator.filter_schema_for_resource_type(schema_data, "XKubEnv")
+
+        summary = filtered["instances"][0]["summary"]
+        assert list(summary) == ["environmentType", "qualityGates", "capacity"]
+
     def test_response_format_validation(self, response_generator):
         """Test response format validation."""
         # Valid response
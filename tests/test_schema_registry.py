@@ -90,6 +90,15 @@ class TestSchemaRegistry(unittest.TestCase):
         schemas = self.registry.get_accessible_schemas("UnknownType")
         self.assertEqual(schemas, [])
 
+    def test_get_accessible_schema_set(self):
+        """Test that the accessible schema set mirrors the hierarchy list."""
+        schema_set = self.registry.get_accessible_schema_set("XApp")
+
+        self.assertIsInstance(schema_set, frozenset)
+        self.assertEqual(schema_set, frozenset(self.registry.get_accessible_schemas("XApp")))
+        self.assertIs(schema_set, self.registry.get_accessible_schema_set("XApp"))
+        self.assertEqual(self.registry.get_accessible_schema_set("UnknownType"), frozenset())
+
     def test_get_schema_info(self):
         """Test getting schema information for a resource type."""
         schema_info = self.registry.get_schema_info("XApp")
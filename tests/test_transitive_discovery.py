@@ -447,6 +447,75 @@ class TestTransitiveDiscoveryIntegration:
         instance_name = kubenv_schema["instances"][0]["name"]
         assert instance_name == "demo-dev"
 
+    def test_transitive_merge_skips_duplicates(self):
+        """Test merging transitive instances into an existing schema entry."""
+        from function.query_processor import QueryProcessor
+        from function.schema_registry import SchemaRegistry
+
+        processor = QueryProcessor(SchemaRegistry(), MagicMock(), MagicMock())
+
+        def discovered(name):
+            return TransitiveDiscoveredResource(
+                name=name,
+                namespace="test",
+                kind="XKubEnv",
+                api_version="platform.kubecore.io/v1alpha1",
+                relationship_path=[],
+                discovery_hops=2,
+                discovery_method="transitive-2",
+                intermediate_resources=[]
+            )
+
+        platform_context = {
+            "availableSchemas": {
+                "kubEnv": {
+                    "metadata": {"discoveryMethod": "direct"},
+                    "instances": [{"name": "demo-dev", "namespace": "test", "summary": {}}]
+                }
+            }
+        }
+
+        processor._process_transitive_schema(
+            "kubEnv",
+            [discovered("demo-dev"), discovered("demo-prod"), discovered("demo-prod")],
+            platform_context
+        )
+
+        kubenv_schema = platform_context["availableSchemas"]["kubEnv"]
+        assert [inst["name"] for inst in kubenv_schema["instances"]] == ["demo-dev", "demo-prod"]
+        assert kubenv_schema["metadata"]["discoveryMethod"] == "hybrid"
+
+    def test_transitive_new_schema_skips_duplicates(self):
+        """Test that duplicates within one batch are dropped for a new schema entry."""
+        from function.query_processor import QueryProcessor
+        from function.schema_registry import SchemaRegistry
+
+        processor = QueryProcessor(SchemaRegistry(), MagicMock(), MagicMock())
+
+        def discovered(name):
+            return TransitiveDiscoveredResource(
+                name=name,
+                namespace="test",
+                kind="XKubEnv",
+                api_version="platform.kubecore.io/v1alpha1",
+                relationship_path=[],
+                discovery_hops=2,
+                discovery_method="transitive-2",
+                intermediate_resources=[]
+            )
+
+        platform_context = {"availableSchemas": {}}
+
+        processor._process_transitive_schema(
+            "kubEnv",
+            [discovered("demo-dev"), discovered("demo-dev"), discovered("demo-prod")],
+            platform_context
+        )
+
+        kubenv_schema = platform_context["availableSchemas"]["kubEnv"]
+        assert [inst["name"] for inst in kubenv_schema["instances"]] == ["demo-dev", "demo-prod"]
+        assert kubenv_schema["metadata"]["discoveryMethod"] == "transitive"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file